@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import uuid
-from datetime import datetime
 from typing import Optional, Union
 
 import redis.asyncio as redis
@@ -11,7 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_db, get_redis
+from app.core.dependencies import get_db, get_pubsub, get_redis
 from app.core.security import User, get_current_user
 from app.db.models import Message, Session
 from app.models.message import (
@@ -23,7 +22,7 @@ from app.models.message import (
     UsageInfo,
 )
 from app.models.session import SessionStatus
-from app.services.pubsub import PubSubService, get_pubsub_service
+from app.services.pubsub import PubSubService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -35,7 +34,7 @@ async def send_chat_message(
     request: ChatRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    redis_client: redis.Redis = Depends(get_redis),
+    pubsub: PubSubService = Depends(get_pubsub),
 ):
     """
     Send a message to a Claude Code session.
@@ -73,11 +72,9 @@ async def send_chat_message(
 
     # Update session status
     session.status = SessionStatus.RUNNING.value
-    session.updated_at = datetime.utcnow()
     await db.commit()
 
     # Push prompt to session's input queue
-    pubsub = await get_pubsub_service(redis_client)
     await pubsub.push_input(session_id, request.prompt)
 
     if request.stream:
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
@@ -11,10 +11,11 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user, get_redis
+from app.core.dependencies import get_current_user, get_pubsub, get_redis
 from app.db.database import get_db
 from app.db.models import DiscordInteraction, Session as SessionModel
-from app.services.discord import get_discord_bot
+from app.services.discord import get_discord_bot, response_channel, response_key
+from app.services.pubsub import PubSubService
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class NotifyRequest(BaseModel):
 class NotifyResponse(BaseModel):
     """Response from notification."""
 
+    # True only once the message has actually been posted to Discord
     success: bool
     interaction_id: str
 
@@ -57,6 +59,48 @@ class AskResponse(BaseModel):
     timed_out: bool = False
 
 
+# Longest a waiter sleeps between LPOPs if it misses the wake-up (e.g. the
+# answer was published before its subscription was in place)
+_RESPONSE_POLL_SECONDS = 5
+
+
+async def _wait_for_response(
+    redis, pubsub: PubSubService, key: str, channel: str, timeout: int
+) -> Optional[str]:
+    """Wait until the bot queues an answer, or return None on timeout.
+
+    Waiters sleep on the shared pub/sub connection and only LPOP, so a pending
+    question never holds a pooled Redis connection while it waits.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    woken = asyncio.Event()
+
+    async def wake(message):
+        woken.set()
+
+    subscription = await pubsub.subscribe_with_callback(channel, wake)
+    try:
+        while True:
+            # Cleared before the LPOP so a wake-up in between isn't lost
+            woken.clear()
+            # An answer pushed while no one was waiting is still queued
+            answer = await redis.lpop(key)
+            if answer is not None:
+                return answer
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(
+                    woken.wait(), min(_RESPONSE_POLL_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await pubsub.unsubscribe(subscription)
+
+
 @router.post("/notify", response_model=NotifyResponse)
 async def notify_user(
     request: NotifyRequest,
@@ -66,8 +110,8 @@ async def notify_user(
 ):
     """Send a notification to the user via Discord.
 
-    This is a fire-and-forget operation - the notification is posted and the
-    request returns immediately without waiting for any user action.
+    The request returns once the message has been posted to the channel, so
+    a failed send surfaces as a 500. It does not wait for any user action.
     """
     # Get Discord bot
     bot = get_discord_bot()
@@ -98,7 +142,6 @@ async def notify_user(
         status="completed",  # Notifications are immediately complete
         timeout_seconds=0,  # No timeout for notifications
         priority=request.priority,
-        created_at=datetime.utcnow(),
     )
 
     db.add(interaction)
@@ -127,6 +170,7 @@ async def ask_user(
     request: AskRequest,
     db: AsyncSession = Depends(get_db),
     redis = Depends(get_redis),
+    pubsub: PubSubService = Depends(get_pubsub),
     user_id: str = Depends(get_current_user),
 ):
     """Ask the user a question via Discord and wait for response.
@@ -172,7 +216,6 @@ async def ask_user(
         timeout_seconds=request.timeout_seconds,
         max_attempts=request.max_attempts,
         priority=request.priority,
-        created_at=datetime.utcnow(),
     )
 
     db.add(interaction)
@@ -215,34 +258,28 @@ async def ask_user(
                 )
 
             # Wait for response with timeout
-            response_key = f"session:{request.session_id}:discord:response:{interaction_id}"
-
-            # Poll Redis for response
-            timeout_at = datetime.utcnow() + timedelta(seconds=request.timeout_seconds)
-            while datetime.utcnow() < timeout_at:
-                # Check if response available
-                response_value = await redis.get(response_key)
-                if response_value:
-                    # Response received!
-                    response_text = response_value.decode('utf-8') if isinstance(response_value, bytes) else str(response_value)
-
-                    # Update interaction
-                    interaction.response = response_text
-                    interaction.status = "answered"
-                    interaction.answered_at = datetime.utcnow()
-                    await db.commit()
-
-                    logger.info(f"Question {interaction_id} answered: {response_text[:50]}")
-
-                    return AskResponse(
-                        interaction_id=interaction_id,
-                        status="answered",
-                        response=response_text,
-                        timed_out=False
-                    )
-
-                # Sleep before next poll
-                await asyncio.sleep(1)
+            response_text = await _wait_for_response(
+                redis,
+                pubsub,
+                response_key(request.session_id, interaction_id),
+                response_channel(request.session_id, interaction_id),
+                request.timeout_seconds,
+            )
+            if response_text is not None:
+                # Update interaction
+                interaction.response = response_text
+                interaction.status = "answered"
+                interaction.answered_at = datetime.now(timezone.utc)
+                await db.commit()
+
+                logger.info(f"Question {interaction_id} answered: {response_text[:50]}")
+
+                return AskResponse(
+                    interaction_id=interaction_id,
+                    status="answered",
+                    response=response_text,
+                    timed_out=False
+                )
 
             # Timeout reached for this attempt
             logger.warning(f"Question {interaction_id} timed out (attempt {attempt}/{request.max_attempts})")
@@ -253,7 +290,7 @@ async def ask_user(
 
     # All attempts failed
     interaction.status = "timeout"
-    interaction.timeout_at = datetime.utcnow()
+    interaction.timeout_at = datetime.now(timezone.utc)
     await db.commit()
 
     logger.error(f"Question {interaction_id} failed after {request.max_attempts} attempts")
@@ -5,6 +5,7 @@ from typing import Optional
 
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_db, get_redis
@@ -91,11 +92,15 @@ async def list_sessions(
     sessions, total = await session_service.list_sessions(
         user.user_id, session_status, limit, offset
     )
-    return SessionList(
-        sessions=sessions,
-        total=total,
-        limit=limit,
-        offset=offset,
+    # orjson encodes datetimes natively, so skip the SessionList wrapper
+    # re-validation and pydantic's JSON-mode conversion pass
+    return ORJSONResponse(
+        {
+            "sessions": [s.model_dump() for s in sessions],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
 
 
@@ -3,10 +3,12 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user
+from app.core.etag import make_etag, not_modified
 from app.core.security import User
 from app.db.database import get_db
 from app.models.task import (
@@ -21,7 +23,6 @@ from app.models.task import (
     TaskStatus,
 )
 from app.services.task import TaskService
-from app.services.scheduler import SchedulerService
 
 logger = logging.getLogger(__name__)
 
@@ -39,30 +40,7 @@ async def create_task(
         task_service = TaskService(db)
         task = await task_service.create_task(task_data)
 
-        return TaskResponse(
-            id=task.id,
-            task_name=task.task_name,
-            task_type=task.task_type,
-            description=task.description,
-            template_prompt=task.template_prompt,
-            required_parameters=task.required_parameters,
-            optional_parameters=task.optional_parameters,
-            schedule_cron=task.schedule_cron,
-            schedule_timezone=task.schedule_timezone,
-            enabled=bool(task.enabled),
-            paused=bool(task.paused),
-            next_run_at=task.next_run_at,
-            last_run_at=task.last_run_at,
-            discord_channel_id=task.discord_channel_id,
-            discord_category_id=task.discord_category_id,
-            owner_user_id=task.owner_user_id,
-            run_count=task.run_count,
-            success_count=task.success_count,
-            failure_count=task.failure_count,
-            avg_duration_seconds=task.avg_duration_seconds,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -76,6 +54,7 @@ async def create_task(
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -89,29 +68,14 @@ async def get_task(
             detail=f"Task {task_id} not found"
         )
 
-    return TaskResponse(
-        id=task.id,
-        task_name=task.task_name,
-        task_type=task.task_type,
-        description=task.description,
-        template_prompt=task.template_prompt,
-        required_parameters=task.required_parameters,
-        optional_parameters=task.optional_parameters,
-        schedule_cron=task.schedule_cron,
-        schedule_timezone=task.schedule_timezone,
-        enabled=bool(task.enabled),
-        paused=bool(task.paused),
-        next_run_at=task.next_run_at,
-        last_run_at=task.last_run_at,
-        discord_channel_id=task.discord_channel_id,
-        discord_category_id=task.discord_category_id,
-        owner_user_id=task.owner_user_id,
-        run_count=task.run_count,
-        success_count=task.success_count,
-        failure_count=task.failure_count,
-        avg_duration_seconds=task.avg_duration_seconds,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
+    # Version the representation by updated_at so unchanged tasks skip serialization
+    etag = make_etag(f"{task.id}:{task.updated_at.isoformat()}".encode())
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return ORJSONResponse(
+        TaskResponse.model_validate(task).model_dump(mode="json"),
+        headers={"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"},
     )
 
 
@@ -134,39 +98,16 @@ async def list_tasks(
         offset=offset,
     )
 
-    task_responses = [
-        TaskResponse(
-            id=t.id,
-            task_name=t.task_name,
-            task_type=t.task_type,
-            description=t.description,
-            template_prompt=t.template_prompt,
-            required_parameters=t.required_parameters,
-            optional_parameters=t.optional_parameters,
-            schedule_cron=t.schedule_cron,
-            schedule_timezone=t.schedule_timezone,
-            enabled=bool(t.enabled),
-            paused=bool(t.paused),
-            next_run_at=t.next_run_at,
-            last_run_at=t.last_run_at,
-            discord_channel_id=t.discord_channel_id,
-            discord_category_id=t.discord_category_id,
-            owner_user_id=t.owner_user_id,
-            run_count=t.run_count,
-            success_count=t.success_count,
-            failure_count=t.failure_count,
-            avg_duration_seconds=t.avg_duration_seconds,
-            created_at=t.created_at,
-            updated_at=t.updated_at,
-        )
-        for t in tasks
-    ]
-
-    return TaskListResponse(
-        tasks=task_responses,
-        total=total,
-        limit=limit,
-        offset=offset,
+    # Dump once and hand orjson plain dicts, skipping FastAPI's
+    # response_model re-validation and jsonable_encoder pass; orjson
+    # encodes datetimes itself so python-mode dumps are enough
+    return ORJSONResponse(
+        {
+            "tasks": [TaskResponse.model_validate(t).model_dump() for t in tasks],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
 
 
@@ -182,30 +123,7 @@ async def update_task(
         task_service = TaskService(db)
         task = await task_service.update_task(task_id, task_data)
 
-        return TaskResponse(
-            id=task.id,
-            task_name=task.task_name,
-            task_type=task.task_type,
-            description=task.description,
-            template_prompt=task.template_prompt,
-            required_parameters=task.required_parameters,
-            optional_parameters=task.optional_parameters,
-            schedule_cron=task.schedule_cron,
-            schedule_timezone=task.schedule_timezone,
-            enabled=bool(task.enabled),
-            paused=bool(task.paused),
-            next_run_at=task.next_run_at,
-            last_run_at=task.last_run_at,
-            discord_channel_id=task.discord_channel_id,
-            discord_category_id=task.discord_category_id,
-            owner_user_id=task.owner_user_id,
-            run_count=task.run_count,
-            success_count=task.success_count,
-            failure_count=task.failure_count,
-            avg_duration_seconds=task.avg_duration_seconds,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -278,6 +196,7 @@ async def start_task(
 async def schedule_task(
     task_id: str,
     schedule_data: TaskSchedule,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -299,34 +218,11 @@ async def schedule_task(
         )
         task = await task_service.update_task(task_id, update_data)
 
-        # Add to scheduler
-        scheduler = SchedulerService()
+        # Add to the running scheduler started in the app lifespan
+        scheduler = request.app.state.scheduler
         await scheduler.add_task_schedule(task, db)
 
-        return TaskResponse(
-            id=task.id,
-            task_name=task.task_name,
-            task_type=task.task_type,
-            description=task.description,
-            template_prompt=task.template_prompt,
-            required_parameters=task.required_parameters,
-            optional_parameters=task.optional_parameters,
-            schedule_cron=task.schedule_cron,
-            schedule_timezone=task.schedule_timezone,
-            enabled=bool(task.enabled),
-            paused=bool(task.paused),
-            next_run_at=task.next_run_at,
-            last_run_at=task.last_run_at,
-            discord_channel_id=task.discord_channel_id,
-            discord_category_id=task.discord_category_id,
-            owner_user_id=task.owner_user_id,
-            run_count=task.run_count,
-            success_count=task.success_count,
-            failure_count=task.failure_count,
-            avg_duration_seconds=task.avg_duration_seconds,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -377,14 +273,16 @@ async def get_task_history(
             compute_time_seconds=r.compute_time_seconds,
             pages_loaded=r.pages_loaded,
             created_at=r.created_at,
-        )
+        ).model_dump()
         for r in runs
     ]
 
-    return TaskHistoryResponse(
-        task_name=task.task_name,
-        runs=run_responses,
-        total=total,
-        limit=limit,
-        offset=offset,
+    return ORJSONResponse(
+        {
+            "task_name": task.task_name,
+            "runs": run_responses,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
@@ -1,28 +1,90 @@
 """WebSocket streaming for real-time Claude Code output."""
 
 import asyncio
-import json
 import logging
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 
-import redis.asyncio as redis
+import msgspec
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.dependencies import get_db, get_redis
+from app.core.dependencies import get_db, get_pubsub, get_redis
 from app.core.security import decode_token
 from app.db.database import get_db_context
 from app.db.models import Session
-from app.models.message import WSMessageType
+from app.models.message import (
+    WSChildResultFrame,
+    WSClientMessageFast,
+    WSErrorFrame,
+    WSMessageType,
+    WSPongFrame,
+    WSResultFrame,
+    WSSystemFrame,
+)
 from app.models.session import SessionStatus
-from app.services.pubsub import PubSubService, get_pubsub_service
+from app.services.pubsub import PubSubService
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 router = APIRouter()
 
+_ws_encoder = msgspec.json.Encoder()
+_ws_decoder = msgspec.json.Decoder(WSClientMessageFast)
+
+_PONG = _ws_encoder.encode(WSPongFrame()).decode()
+
+
+WS_BATCH_MAX_MESSAGES = 16
+WS_BATCH_INTERVAL_SECONDS = 0.005
+
+
+def encode_ws_message(message: Any) -> str:
+    """Encode an outbound frame (struct or pass-through dict) as JSON text."""
+    # Sent as text frames so browser clients can JSON.parse event.data directly
+    return _ws_encoder.encode(message).decode()
+
+
+class BatchedSender:
+    """Coalesces bursts of outbound frames into a single batch frame.
+
+    Enabled per connection with ``?batch=1``. Frames queued within
+    WS_BATCH_INTERVAL_SECONDS (up to WS_BATCH_MAX_MESSAGES) are sent as
+    ``{"type": "batch", "messages": [...]}``; a lone frame is sent as is.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def send(self, text: str) -> None:
+        """Queue an already-encoded frame."""
+        await self._queue.put(text)
+
+    async def run(self) -> None:
+        """Flush queued frames until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + WS_BATCH_INTERVAL_SECONDS
+            while len(batch) < WS_BATCH_MAX_MESSAGES:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) == 1:
+                await self.websocket.send_text(batch[0])
+            else:
+                # Frames are already JSON, so splice them instead of re-encoding
+                await self.websocket.send_text(
+                    '{"type":"batch","messages":[' + ",".join(batch) + "]}"
+                )
+
 
 class ConnectionManager:
     """Manages WebSocket connections for sessions."""
@@ -47,13 +109,15 @@ class ConnectionManager:
                 del self.active_connections[session_id]
         logger.info(f"WebSocket disconnected for session {session_id}")
 
-    async def broadcast(self, session_id: str, message: dict) -> None:
+    async def broadcast(self, session_id: str, message: Any) -> None:
         """Broadcast a message to all connections for a session."""
         if session_id in self.active_connections:
+            # Encode once for every subscriber
+            text = encode_ws_message(message)
             disconnected = []
             for connection in self.active_connections[session_id]:
                 try:
-                    await connection.send_json(message)
+                    await connection.send_text(text)
                 except Exception:
                     disconnected.append(connection)
 
@@ -91,6 +155,7 @@ async def authenticate_websocket(websocket: WebSocket) -> Optional[str]:
 async def websocket_stream(
     websocket: WebSocket,
     session_id: str,
+    pubsub: PubSubService = Depends(get_pubsub),
 ):
     """
     WebSocket endpoint for streaming Claude Code output.
@@ -108,6 +173,8 @@ async def websocket_stream(
     - {"type": "result", "subtype": "success", "result": "...", ...}
     - {"type": "system", "event": "...", "data": {...}}
     - {"type": "pong"}
+
+    With ?batch=1, bursts arrive as {"type": "batch", "messages": [...]}.
     """
     # Authenticate
     user_id = await authenticate_websocket(websocket)
@@ -115,9 +182,6 @@ async def websocket_stream(
         await websocket.close(code=4001, reason="Unauthorized")
         return
 
-    # Connect Redis
-    redis_client = redis.from_url(settings.redis_url, decode_responses=True)
-
     try:
         # Verify session exists
         async with get_db_context() as db:
@@ -131,28 +195,35 @@ async def websocket_stream(
         await manager.connect(session_id, websocket)
 
         # Send session started event
-        await websocket.send_json(
-            {
-                "type": WSMessageType.SYSTEM,
-                "event": "session_connected",
-                "data": {"session_id": session_id},
-            }
+        await websocket.send_text(
+            encode_ws_message(
+                WSSystemFrame(
+                    event="session_connected",
+                    data={"session_id": session_id},
+                )
+            )
         )
 
-        # Create pubsub service
-        pubsub = PubSubService(redis_client)
+        # Clients opt in to batched frames with ?batch=1
+        tasks = []
+        send = None
+        if websocket.query_params.get("batch") == "1":
+            sender = BatchedSender(websocket)
+            send = sender.send
+            tasks.append(asyncio.create_task(sender.run()))
 
         # Start tasks for receiving messages and forwarding output
         receive_task = asyncio.create_task(
             handle_client_messages(websocket, session_id, pubsub)
         )
         forward_task = asyncio.create_task(
-            forward_session_output(websocket, session_id, pubsub)
+            forward_session_output(websocket, session_id, pubsub, send)
         )
+        tasks += [receive_task, forward_task]
 
-        # Wait for either task to complete
+        # Wait for any task to complete
         done, pending = await asyncio.wait(
-            [receive_task, forward_task],
+            tasks,
             return_when=asyncio.FIRST_COMPLETED,
         )
 
@@ -169,17 +240,15 @@ async def websocket_stream(
     except Exception as e:
         logger.error(f"WebSocket error for session {session_id}: {e}")
         try:
-            await websocket.send_json(
-                {
-                    "type": WSMessageType.ERROR,
-                    "data": {"error": str(e)},
-                }
+            await websocket.send_text(
+                encode_ws_message(
+                    WSErrorFrame(data={"error": str(e)})
+                )
             )
         except Exception:
             pass
     finally:
         manager.disconnect(session_id, websocket)
-        await redis_client.aclose()
 
 
 async def handle_client_messages(
@@ -190,14 +259,19 @@ async def handle_client_messages(
     """Handle incoming messages from WebSocket client."""
     try:
         while True:
-            data = await websocket.receive_json()
-            msg_type = data.get("type")
+            raw = await websocket.receive_text()
+            try:
+                # Decode straight into the struct, no intermediate dict
+                data = _ws_decoder.decode(raw)
+            except msgspec.DecodeError as e:
+                logger.warning(f"Ignoring malformed WebSocket message for session {session_id}: {e}")
+                continue
 
-            if msg_type == "ping":
-                await websocket.send_json({"type": "pong"})
+            if data.type == WSMessageType.PING:
+                await websocket.send_text(_PONG)
 
-            elif msg_type == "prompt":
-                prompt = data.get("prompt")
+            elif data.type == WSMessageType.PROMPT:
+                prompt = data.prompt
                 if prompt:
                     await pubsub.push_input(session_id, prompt)
                     logger.info(f"Received prompt for session {session_id}")
@@ -213,8 +287,10 @@ async def forward_session_output(
     websocket: WebSocket,
     session_id: str,
     pubsub: PubSubService,
+    send: Optional[Callable[[str], Awaitable[None]]] = None,
 ) -> None:
     """Forward session output to WebSocket client."""
+    send = send or websocket.send_text
     try:
         async for message in pubsub.subscribe_session_output(session_id):
             msg_type = message.get("type")
@@ -222,35 +298,36 @@ async def forward_session_output(
 
             if msg_type == "output":
                 # Forward Claude Code output directly
-                await websocket.send_json(data)
+                await send(encode_ws_message(data))
 
             elif msg_type == "result":
                 # Send result message
-                await websocket.send_json(
-                    {
-                        "type": WSMessageType.RESULT,
-                        "subtype": data.get("subtype", "success"),
-                        "result": data.get("result"),
-                        "usage": data.get("usage"),
-                    }
+                await send(
+                    encode_ws_message(
+                        WSResultFrame(
+                            subtype=data.get("subtype", "success"),
+                            result=data.get("result"),
+                            usage=data.get("usage"),
+                        )
+                    )
                 )
 
             elif msg_type == "child_result":
                 # Forward child session result
-                await websocket.send_json(
-                    {
-                        "type": WSMessageType.CHILD_RESULT,
-                        "child_session_id": message.get("child_session_id"),
-                        "result": data,
-                    }
+                await send(
+                    encode_ws_message(
+                        WSChildResultFrame(
+                            child_session_id=message.get("child_session_id"),
+                            result=data,
+                        )
+                    )
                 )
 
             elif msg_type == "error":
-                await websocket.send_json(
-                    {
-                        "type": WSMessageType.ERROR,
-                        "data": data,
-                    }
+                await send(
+                    encode_ws_message(
+                        WSErrorFrame(data=data)
+                    )
                 )
 
     except asyncio.CancelledError:
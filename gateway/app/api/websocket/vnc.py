@@ -53,7 +53,7 @@ async def websocket_vnc_proxy(
     container's VNC server running on port 5900.
 
     Usage:
-    - Connect noVNC client to: ws://gateway/api/v1/sessions/{session_id}/vnc?token={jwt}
+    - Connect noVNC client to: ws://gateway/ws/v1/sessions/{session_id}/vnc?token={jwt}
     - VNC traffic is proxied bidirectionally to container's port 5900
     """
     # Authenticate
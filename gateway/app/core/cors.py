@@ -0,0 +1,59 @@
+"""Pure ASGI CORS middleware for an explicit origin allowlist."""
+
+from typing import Iterable
+
+ALLOW_METHODS = b"DELETE, GET, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class CORSMiddleware:
+    """Adds CORS headers only for requests from an allowed Origin.
+
+    Same-origin and non-browser requests carry no Origin header and are
+    passed straight through without touching the response.
+    """
+
+    def __init__(self, app, allow_origins: Iterable[str]):
+        self.app = app
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or origin not in self.allow_origins:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            cors_headers.append((b"access-control-allow-methods", ALLOW_METHODS))
+            cors_headers.append((b"access-control-max-age", PREFLIGHT_MAX_AGE))
+            if request_headers:
+                cors_headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": cors_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
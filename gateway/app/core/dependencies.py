@@ -4,15 +4,24 @@ from typing import AsyncGenerator
 
 import redis.asyncio as redis
 from aiobotocore.session import get_session
+from fastapi import Request
+from starlette.requests import HTTPConnection
 
 from app.core.config import get_settings
 from app.db.database import get_db
+from app.services.pubsub import PubSubService
 
 settings = get_settings()
 
 
-async def get_redis() -> AsyncGenerator[redis.Redis, None]:
+async def get_redis(request: Request) -> AsyncGenerator[redis.Redis, None]:
     """Dependency for getting Redis connection."""
+    # Reuse the lifespan-owned pool; it is closed at shutdown, not per request
+    pool = getattr(request.app.state, "redis_pool", None)
+    if pool is not None:
+        yield redis.Redis(connection_pool=pool)
+        return
+
     client = redis.from_url(settings.redis_url, decode_responses=True)
     try:
         yield client
@@ -20,6 +29,23 @@ async def get_redis() -> AsyncGenerator[redis.Redis, None]:
         await client.aclose()
 
 
+async def get_pubsub(conn: HTTPConnection) -> AsyncGenerator[PubSubService, None]:
+    """Dependency for the app-wide pub/sub service (HTTP and WebSocket routes)."""
+    # Shared so subscribers multiplex onto one Redis connection
+    pubsub = getattr(conn.app.state, "pubsub", None)
+    if pubsub is not None:
+        yield pubsub
+        return
+
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    pubsub = PubSubService(client)
+    try:
+        yield pubsub
+    finally:
+        await pubsub.close()
+        await client.aclose()
+
+
 async def get_minio_client():
     """Dependency for getting MinIO client."""
     session = get_session()
@@ -35,4 +61,4 @@ async def get_minio_client():
 from app.core.security import get_current_user
 
 # Re-export for convenience
-__all__ = ["get_db", "get_redis", "get_minio_client", "get_current_user"]
+__all__ = ["get_db", "get_redis", "get_pubsub", "get_minio_client", "get_current_user"]
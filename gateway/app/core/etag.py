@@ -0,0 +1,29 @@
+"""HTTP ETag helpers for read-mostly endpoints."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(data: bytes) -> str:
+    """Build a strong ETag from response content or a version key."""
+    return f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the current representation."""
+    return request.headers.get("if-none-match") == etag
+
+
+def etag_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    max_age: int = 60,
+    media_type: str = "application/json",
+) -> Response:
+    """Return a cacheable response, or 304 if the client's ETag matches."""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
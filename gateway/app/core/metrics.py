@@ -0,0 +1,37 @@
+"""Prometheus exposition endpoint with a short-lived output cache."""
+
+import time
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+
+
+class CachedMetricsApp:
+    """ASGI app serving the registry's text exposition, regenerated at most every `ttl` seconds."""
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY, ttl: float = 5.0):
+        self.registry = registry
+        self.ttl = ttl
+        self._body: Optional[bytes] = None
+        self._generated_at = 0.0
+        self._headers = [
+            (b"content-type", CONTENT_TYPE_LATEST.encode("latin-1")),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+
+        now = time.monotonic()
+        if self._body is None or now - self._generated_at >= self.ttl:
+            self._body = generate_latest(self.registry)
+            self._generated_at = now
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": self._headers + [(b"content-length", str(len(self._body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": self._body})
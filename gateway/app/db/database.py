@@ -3,6 +3,7 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
@@ -13,7 +14,9 @@ from app.core.config import get_settings
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base."""
 
-    pass
+    # Timestamps are stamped by the database (server_default/onupdate=now());
+    # fetch them back via RETURNING so attributes are loaded after flush
+    __mapper_args__ = {"eager_defaults": True}
 
 
 settings = get_settings()
@@ -42,8 +45,21 @@ async_session_maker = async_sessionmaker(
 async def init_db() -> None:
     """Initialize the database, creating all tables."""
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Task/template names use CITEXT for case-insensitive uniqueness
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
         await conn.run_sync(Base.metadata.create_all)
 
+        from app.db.models import SCHEMA_UPGRADE_DDL, TASK_STATS_DDL
+
+        # create_all leaves existing tables alone; upgrade them in place
+        for statement in SCHEMA_UPGRADE_DDL.get(conn.dialect.name, []):
+            await conn.execute(statement)
+
+        # Task run counters are kept by triggers; replace them idempotently
+        for statement in TASK_STATS_DDL.get(conn.dialect.name, []):
+            await conn.execute(statement)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions."""
@@ -1,14 +1,40 @@
 """SQLAlchemy ORM models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import JSON, Float, ForeignKey, Index, Integer, String, Text, DateTime
+from sqlalchemy import (
+    DDL,
+    JSON,
+    CheckConstraint,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
 
 
+def _utcnow() -> datetime:
+    """Python-side stamp, for tables created before the server default existed."""
+    return datetime.now(timezone.utc)
+
+
+# Discord snowflakes are at most 19 decimal digits
+DiscordID = String(20)
+
+# Case-insensitive names on PostgreSQL (citext extension); plain VARCHAR elsewhere
+CaseInsensitiveName = String(128).with_variant(postgresql.CITEXT(), "postgresql")
+
+
 class Session(Base):
     """Session database model."""
 
@@ -24,12 +50,12 @@ class Session(Base):
     workspace_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     config: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=func.now()
     )
-    stopped_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    stopped_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     total_cost_usd: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     total_turns: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -72,7 +98,7 @@ class Message(Base):
     tokens_out: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now()
     )
 
     # Relationships
@@ -90,8 +116,8 @@ class DiscordInteraction(Base):
     session_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("sessions.id"), nullable=False
     )
-    discord_thread_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    discord_message_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    discord_thread_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
+    discord_message_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
     interaction_type: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # 'question' or 'notification'
@@ -107,15 +133,23 @@ class DiscordInteraction(Base):
         String(20), nullable=False, default="normal"
     )  # 'normal' or 'urgent'
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now()
     )
-    answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    timeout_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    timeout_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
         Index("idx_discord_session", "session_id"),
         Index("idx_discord_status", "status"),
         Index("idx_discord_thread", "discord_thread_id"),
+        # The startup seed only reads pending questions, so keep this index small
+        Index(
+            "idx_discord_pending_type",
+            "interaction_type",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
     )
 
 
@@ -125,7 +159,7 @@ class Task(Base):
     __tablename__ = "tasks"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    task_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    task_name: Mapped[str] = mapped_column(CaseInsensitiveName, unique=True, nullable=False)
     task_type: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -139,16 +173,16 @@ class Task(Base):
     schedule_timezone: Mapped[str] = mapped_column(String(50), nullable=False, default="UTC")
     enabled: Mapped[bool] = mapped_column(Integer, nullable=False, default=1)
     paused: Mapped[bool] = mapped_column(Integer, nullable=False, default=0)
-    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Configuration
     config: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
 
     # Discord
-    discord_channel_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    discord_category_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    discord_thread_id_current: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    discord_channel_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
+    discord_category_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
+    discord_thread_id_current: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
     owner_user_id: Mapped[str] = mapped_column(String(64), nullable=False)
 
     # Dependencies
@@ -161,17 +195,17 @@ class Task(Base):
     notify_on_complete: Mapped[bool] = mapped_column(Integer, nullable=False, default=1)
     notify_on_error: Mapped[bool] = mapped_column(Integer, nullable=False, default=1)
 
-    # Metadata
+    # Metadata (maintained by the task_run_stats trigger, keep unindexed for HOT updates)
     run_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     avg_duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=func.now())
     created_by: Mapped[str] = mapped_column(String(64), nullable=False)
-    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     task_runs: Mapped[list["TaskRun"]] = relationship("TaskRun", back_populates="task", cascade="all, delete-orphan")
@@ -182,6 +216,8 @@ class Task(Base):
         Index("idx_tasks_owner", "owner_user_id"),
         Index("idx_tasks_next_run", "next_run_at"),
         Index("idx_tasks_discord_channel", "discord_channel_id"),
+        # Leave page headroom so counter bumps stay heap-only
+        {"postgresql_with": {"fillfactor": 85}},
     )
 
 
@@ -198,13 +234,13 @@ class TaskRun(Base):
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="scheduled")
     trigger: Mapped[str] = mapped_column(String(20), nullable=False, default="manual")
     parameters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Discord tracking
-    discord_channel_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    discord_thread_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    discord_channel_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
+    discord_thread_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
     discord_messages: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # Results
@@ -223,9 +259,9 @@ class TaskRun(Base):
     # Human intervention
     required_intervention: Mapped[bool] = mapped_column(Integer, nullable=False, default=0)
     intervention_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    intervention_resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    intervention_resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     vnc_session_active: Mapped[bool] = mapped_column(Integer, nullable=False, default=0)
-    vnc_accessed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    vnc_accessed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Metrics
     tokens_used: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
@@ -237,8 +273,8 @@ class TaskRun(Base):
     step_timings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     task: Mapped["Task"] = relationship("Task", back_populates="task_runs")
@@ -249,6 +285,9 @@ class TaskRun(Base):
         Index("idx_task_runs_status", "status"),
         Index("idx_task_runs_started_at", "started_at"),
         Index("idx_task_runs_discord_thread", "discord_thread_id"),
+        CheckConstraint(
+            "length(error_stacktrace) < 65536", name="ck_task_runs_error_stacktrace_length"
+        ),
     )
 
 
@@ -258,7 +297,7 @@ class TaskTemplate(Base):
     __tablename__ = "task_templates"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    template_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    template_name: Mapped[str] = mapped_column(CaseInsensitiveName, unique=True, nullable=False)
     template_type: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -272,8 +311,8 @@ class TaskTemplate(Base):
     use_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     rating_average: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=func.now())
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     __table_args__ = (
@@ -292,7 +331,7 @@ class TaskDependency(Base):
     task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
     depends_on_task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
     required: Mapped[bool] = mapped_column(Integer, nullable=False, default=1)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
     created_by: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Relationships
@@ -310,16 +349,16 @@ class DiscordChannel(Base):
     __tablename__ = "discord_channels"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    channel_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    channel_id: Mapped[str] = mapped_column(DiscordID, unique=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    category_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    category_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
     category_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     channel_type: Mapped[str] = mapped_column(String(20), nullable=False)
 
     task_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -335,17 +374,17 @@ class DiscordThread(Base):
     __tablename__ = "discord_threads"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    thread_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    thread_id: Mapped[str] = mapped_column(DiscordID, unique=True, nullable=False)
     thread_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    parent_channel_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    parent_channel_id: Mapped[str] = mapped_column(DiscordID, nullable=False)
 
     task_run_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("task_runs.id"), nullable=True)
     session_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=True)
 
     status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -364,9 +403,9 @@ class DiscordMessage(Base):
     __tablename__ = "discord_messages"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    message_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
-    channel_id: Mapped[str] = mapped_column(String(64), nullable=False)
-    thread_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    message_id: Mapped[str] = mapped_column(DiscordID, unique=True, nullable=False)
+    channel_id: Mapped[str] = mapped_column(DiscordID, nullable=False)
+    thread_id: Mapped[Optional[str]] = mapped_column(DiscordID, nullable=True)
 
     task_run_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("task_runs.id"), nullable=True)
     interaction_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("discord_interactions.id"), nullable=True)
@@ -377,7 +416,7 @@ class DiscordMessage(Base):
     attachments: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     buttons: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
-    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
 
     # Relationships
     task_run: Mapped[Optional["TaskRun"]] = relationship("TaskRun")
@@ -404,7 +443,7 @@ class ScheduleHistory(Base):
     triggered_by: Mapped[str] = mapped_column(String(20), nullable=False)
     user_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
     extra_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # Relationships
@@ -428,7 +467,7 @@ class PushoverNotification(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
-    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
     pushover_response: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     success: Mapped[Optional[bool]] = mapped_column(Integer, nullable=True)
 
@@ -439,3 +478,195 @@ class PushoverNotification(Base):
         Index("idx_pushover_notifications_task_run", "task_run_id"),
         Index("idx_pushover_notifications_sent_at", "sent_at"),
     )
+
+
+# Task run counters are bumped in the database so a run never needs a
+# SELECT + UPDATE round trip on its parent task.
+_BUMP_TASK_STATS_PG = DDL("""
+CREATE OR REPLACE FUNCTION bump_task_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE tasks
+        SET run_count = run_count + 1, last_run_at = now(), updated_at = now()
+        WHERE id = NEW.task_id;
+    ELSIF NEW.status IS DISTINCT FROM OLD.status
+          AND NEW.status IN ('completed', 'failed', 'cancelled') THEN
+        UPDATE tasks
+        SET success_count = success_count + CASE WHEN NEW.status = 'completed' THEN 1 ELSE 0 END,
+            failure_count = failure_count + CASE WHEN NEW.status = 'failed' THEN 1 ELSE 0 END,
+            avg_duration_seconds = CASE
+                WHEN NEW.duration_seconds IS NULL OR NEW.duration_seconds = 0 THEN avg_duration_seconds
+                WHEN avg_duration_seconds IS NULL OR avg_duration_seconds = 0 THEN NEW.duration_seconds
+                ELSE (avg_duration_seconds * (run_count - 1) + NEW.duration_seconds) / run_count
+            END,
+            updated_at = now()
+        WHERE id = NEW.task_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+_TASK_RUN_STATS_TRIGGER_PG = DDL("""
+CREATE TRIGGER task_run_stats
+AFTER INSERT OR UPDATE OF status ON task_runs
+FOR EACH ROW EXECUTE FUNCTION bump_task_stats()
+""")
+
+# SQLite (local dev and tests) gets equivalent triggers so the counters
+# behave the same without the application maintaining them.
+_TASK_RUN_INSERT_TRIGGER_SQLITE = DDL("""
+CREATE TRIGGER task_run_stats_insert AFTER INSERT ON task_runs
+BEGIN
+    UPDATE tasks
+    SET run_count = run_count + 1, last_run_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+    WHERE id = NEW.task_id;
+END
+""")
+
+_TASK_RUN_STATUS_TRIGGER_SQLITE = DDL("""
+CREATE TRIGGER task_run_stats_status AFTER UPDATE OF status ON task_runs
+WHEN NEW.status IS NOT OLD.status AND NEW.status IN ('completed', 'failed', 'cancelled')
+BEGIN
+    UPDATE tasks
+    SET success_count = success_count + (NEW.status = 'completed'),
+        failure_count = failure_count + (NEW.status = 'failed'),
+        avg_duration_seconds = CASE
+            WHEN NEW.duration_seconds IS NULL OR NEW.duration_seconds = 0 THEN avg_duration_seconds
+            WHEN avg_duration_seconds IS NULL OR avg_duration_seconds = 0 THEN NEW.duration_seconds
+            ELSE (avg_duration_seconds * (run_count - 1) + NEW.duration_seconds) / run_count
+        END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = NEW.task_id;
+END
+""")
+
+# Installed by init_db on every startup (not only when task_runs is first
+# created), so existing databases pick up changes to the triggers
+TASK_STATS_DDL = {
+    "postgresql": [
+        _BUMP_TASK_STATS_PG,
+        DDL("DROP TRIGGER IF EXISTS task_run_stats ON task_runs"),
+        _TASK_RUN_STATS_TRIGGER_PG,
+    ],
+    "sqlite": [
+        DDL("DROP TRIGGER IF EXISTS task_run_stats_insert"),
+        _TASK_RUN_INSERT_TRIGGER_SQLITE,
+        DDL("DROP TRIGGER IF EXISTS task_run_stats_status"),
+        _TASK_RUN_STATUS_TRIGGER_SQLITE,
+    ],
+}
+
+
+# Tables created before timestamps became TIMESTAMPTZ still have naive
+# "timestamp" columns; convert them (stored values are UTC) on startup.
+# Columns that are already timestamptz are skipped, so this is a no-op
+# once a database has been upgraded
+_TIMESTAMPTZ_UPGRADE_PG = text(f"""
+DO $$
+DECLARE col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND data_type = 'timestamp without time zone'
+          AND table_name IN ({", ".join(f"'{name}'" for name in Base.metadata.tables)})
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE timestamptz USING %I AT TIME ZONE ''UTC''',
+            col.table_name, col.column_name, col.column_name
+        );
+    END LOOP;
+END
+$$
+""")
+
+def _columns_of_type(type_) -> str:
+    """SQL list of ('table', 'column') pairs for every column declared with type_."""
+    return ", ".join(
+        f"('{table.name}', '{column.name}')"
+        for table in Base.metadata.tables.values()
+        for column in table.columns
+        if column.type is type_
+    )
+
+
+# Discord ID columns from before the right-sizing are VARCHAR(64). A column
+# holding longer values is left wide (with a warning) rather than failing startup
+_DISCORD_ID_UPGRADE_PG = text(f"""
+DO $$
+DECLARE col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND character_maximum_length > 20
+          AND (table_name, column_name) IN ({_columns_of_type(DiscordID)})
+    LOOP
+        BEGIN
+            EXECUTE format(
+                'ALTER TABLE %I ALTER COLUMN %I TYPE varchar(20)',
+                col.table_name, col.column_name
+            );
+        EXCEPTION WHEN string_data_right_truncation THEN
+            RAISE WARNING '%.% holds values over 20 characters; left unchanged',
+                col.table_name, col.column_name;
+        END;
+    END LOOP;
+END
+$$
+""")
+
+# Task and template names from before CITEXT are case-sensitive VARCHAR. If
+# existing names differ only in case the unique index can't be rebuilt, so
+# that column stays case-sensitive (with a warning) until they are renamed
+_CITEXT_NAME_UPGRADE_PG = text(f"""
+DO $$
+DECLARE col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND udt_name <> 'citext'
+          AND (table_name, column_name) IN ({_columns_of_type(CaseInsensitiveName)})
+    LOOP
+        BEGIN
+            EXECUTE format(
+                'ALTER TABLE %I ALTER COLUMN %I TYPE citext',
+                col.table_name, col.column_name
+            );
+        EXCEPTION WHEN unique_violation THEN
+            RAISE WARNING '%.% has names differing only in case; left case-sensitive',
+                col.table_name, col.column_name;
+        END;
+    END LOOP;
+END
+$$
+""")
+
+# NOT VALID: enforced for new and updated rows without scanning old ones
+_STACKTRACE_CHECK_UPGRADE_PG = text("""
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'ck_task_runs_error_stacktrace_length'
+    ) THEN
+        ALTER TABLE task_runs ADD CONSTRAINT ck_task_runs_error_stacktrace_length
+            CHECK (length(error_stacktrace) < 65536) NOT VALID;
+    END IF;
+END
+$$
+""")
+
+
+# Brings databases created by older versions up to the current column
+# definitions, since create_all never alters existing tables. Run by
+# init_db before the triggers, and safe to repeat
+SCHEMA_UPGRADE_DDL = {
+    "postgresql": [
+        _TIMESTAMPTZ_UPGRADE_PG,
+        _DISCORD_ID_UPGRADE_PG,
+        _CITEXT_NAME_UPGRADE_PG,
+        _STACKTRACE_CHECK_UPGRADE_PG,
+    ],
+}
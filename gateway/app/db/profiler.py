@@ -0,0 +1,81 @@
+"""Development-only SQL profiler for slow queries and N+1 patterns."""
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class QueryStats:
+    """Statement count and cumulative time for a single request."""
+
+    __slots__ = ("count", "total_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("qstart", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["qstart"].pop()) * 1000
+
+    if elapsed_ms >= settings.slow_query_ms:
+        logger.warning(f"Slow query ({elapsed_ms:.1f} ms): {statement}")
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+
+
+def register_query_profiler(engine: AsyncEngine) -> None:
+    """Attach timing hooks to the engine's cursor execution events."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    logger.info(
+        f"Query profiler enabled (slow >= {settings.slow_query_ms} ms, "
+        f"N+1 >= {settings.n_plus_one_threshold} queries)"
+    )
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware logging per-request query counts."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_stats.reset(token)
+            if stats.count:
+                message = (
+                    f"{scope['method']} {scope['path']}: "
+                    f"{stats.count} queries in {stats.total_ms:.1f} ms"
+                )
+                if stats.count >= settings.n_plus_one_threshold:
+                    logger.warning(f"{message} (probable N+1)")
+                else:
+                    logger.info(message)
@@ -1,24 +1,27 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 import redis.asyncio as redis
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from prometheus_client import make_asgi_app
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import chat, discord, health, sessions, spawn, tasks
 from app.api.websocket import stream, vnc
 from app.core.config import get_settings
+from app.core.cors import CORSMiddleware
+from app.core.etag import etag_response, make_etag
+from app.core.metrics import CachedMetricsApp
 from app.core.security import create_token
-from app.db.database import init_db, get_db
-from app.services.container import container_manager
-from app.services.discord import start_discord_bot, stop_discord_bot
-from app.services.scheduler import SchedulerService
+from app.db.database import engine, get_db_context, init_db
+from app.db.profiler import QueryProfilerMiddleware, register_query_profiler
+from app.services.discord_log import discord_message_log
+from app.services.pubsub import PubSubService
 
 settings = get_settings()
 
@@ -29,6 +32,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Serve test UI
+STATIC_DIR = Path(__file__).parent.parent / "static"
+TEST_UI_PATH = STATIC_DIR / "index.html"
+
+
+@asynccontextmanager
+async def redis_lifespan(app: FastAPI):
+    """Own the Redis connection pool shared by routes and background services."""
+    pool = redis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        decode_responses=True,
+    )
+    redis_client = redis.Redis(connection_pool=pool)
+
+    # Open a few connections up front so the first bursts skip the handshake
+    try:
+        await asyncio.gather(
+            *(redis_client.ping() for _ in range(settings.redis_pool_warmup))
+        )
+    except Exception as e:
+        logger.warning(f"Redis pool warmup failed: {e}")
+
+    app.state.redis_pool = pool
+    # One pub/sub service for the whole app, so every subscriber shares a connection
+    app.state.pubsub = PubSubService(redis_client)
+    try:
+        yield redis_client
+    finally:
+        await app.state.pubsub.close()
+        await pool.disconnect(inuse_connections=True)
+
+
+@asynccontextmanager
+async def discord_lifespan(app: FastAPI, redis_client: redis.Redis, scheduler):
+    """Run the Discord bot and its message log flusher."""
+    from app.services.discord import start_discord_bot, stop_discord_bot
+
+    # Start write-behind flusher for Discord message audit rows
+    await discord_message_log.start()
+    try:
+        await start_discord_bot(redis_client, scheduler)
+        logger.info("Discord bot initialized")
+        try:
+            yield
+        finally:
+            await stop_discord_bot()
+    finally:
+        await discord_message_log.stop()
+
+
+@asynccontextmanager
+async def scheduler_lifespan(app: FastAPI):
+    """Run the task scheduler with all enabled schedules loaded."""
+    # APScheduler and croniter are only needed once the app is serving
+    from app.services.scheduler import SchedulerService
+
+    scheduler = SchedulerService()
+    await scheduler.start()
+    logger.info("Task scheduler started")
+    try:
+        # Load all enabled task schedules from database
+        async with get_db_context() as db:
+            await scheduler.reload_all_schedules(db)
+        logger.info("Task schedules loaded")
+
+        # Store scheduler in app state for access in routes
+        app.state.scheduler = scheduler
+        yield scheduler
+    finally:
+        await scheduler.shutdown()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,39 +112,37 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting CC-Docker Gateway...")
 
+    # Run new tasks inline until their first await (Python 3.12+); the
+    # uvloop event loop itself is selected by uvicorn (--loop uvloop)
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # The test UI only changes on deploy, so read and hash it once
+    if TEST_UI_PATH.exists():
+        app.state.test_html = TEST_UI_PATH.read_bytes()
+        app.state.test_etag = make_etag(app.state.test_html)
+    else:
+        app.state.test_html = None
+
     # Initialize database
     await init_db()
     logger.info("Database initialized")
 
-    # Start Discord bot
-    redis_client = redis.from_url(settings.redis_url, decode_responses=False)
-    await start_discord_bot(redis_client)
-    logger.info("Discord bot initialized")
-
-    # Start task scheduler
-    scheduler = SchedulerService()
-    await scheduler.start()
-    logger.info("Task scheduler started")
-
-    # Load all enabled task schedules from database
-    async for db in get_db():
-        try:
-            await scheduler.reload_all_schedules(db)
-            logger.info("Task schedules loaded")
-        finally:
-            break
-
-    # Store scheduler in app state for access in routes
-    app.state.scheduler = scheduler
+    from app.services.container import container_manager
 
-    yield
+    # Connect to dockerd up front so the first session doesn't pay for it
+    await container_manager.warm_up()
 
-    # Shutdown
-    logger.info("Shutting down CC-Docker Gateway...")
-    await scheduler.shutdown()
-    await stop_discord_bot()
-    await container_manager.close()
-    await redis_client.aclose()
+    # Each subsystem tears down in reverse order, even if a later one fails to start
+    try:
+        # The bot adds /task-schedule jobs to the scheduler, so it starts after
+        # (and stops before) it
+        async with redis_lifespan(app) as redis_client, \
+                scheduler_lifespan(app) as scheduler, \
+                discord_lifespan(app, redis_client, scheduler):
+            yield
+            logger.info("Shutting down CC-Docker Gateway...")
+    finally:
+        await container_manager.close()
 
 
 # Create FastAPI app
@@ -78,39 +152,36 @@ app = FastAPI(
     description="Docker-based service for Claude Code API",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware (requests without an allowed Origin pass straight through)
+app.add_middleware(CORSMiddleware, allow_origins=settings.cors_origins)
+
+# Query profiling is opt-in so production pays nothing for the event hooks
+if settings.profile_queries:
+    register_query_profiler(engine)
+    app.add_middleware(QueryProfilerMiddleware)
 
-# Mount Prometheus metrics
-metrics_app = make_asgi_app()
+# Mount Prometheus metrics (exposition text is cached between scrapes)
+metrics_app = CachedMetricsApp(ttl=settings.metrics_cache_seconds)
 app.mount("/metrics", metrics_app)
 
 # Include routers
 app.include_router(health.router, prefix="/health", tags=["Health"])
-app.include_router(
-    sessions.router, prefix="/api/v1/sessions", tags=["Sessions"]
-)
-app.include_router(
-    chat.router, prefix="/api/v1/sessions", tags=["Chat"]
-)
-app.include_router(
-    spawn.router, prefix="/api/v1/sessions", tags=["Spawn"]
-)
-app.include_router(
-    stream.router, prefix="/api/v1/sessions", tags=["WebSocket"]
-)
-app.include_router(
-    vnc.router, prefix="/api/v1/sessions", tags=["VNC"]
-)
+
+# Session-scoped REST routers share one included branch; the prefix is split
+# so routes declared at "" (e.g. POST /api/v1/sessions) stay valid
+sessions_group = APIRouter(prefix="/api/v1")
+for router, tag in (
+    (sessions.router, "Sessions"),
+    (chat.router, "Chat"),
+    (spawn.router, "Spawn"),
+):
+    sessions_group.include_router(router, prefix="/sessions", tags=[tag])
+app.include_router(sessions_group)
+
 app.include_router(
     discord.router, prefix="/api/v1/discord", tags=["Discord"]
 )
@@ -118,46 +189,70 @@ app.include_router(
     tasks.router, prefix="/api/v1/tasks", tags=["Tasks"]
 )
 
+# WebSocket routes live on a bare sub-app with no HTTP middleware of its own
+ws_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+# Mounted apps see themselves as scope["app"], so share the root app's state
+# (Redis pool, app-wide PubSubService) rather than starting empty
+ws_app.state = app.state
+ws_app.include_router(stream.router)
+ws_app.include_router(vnc.router)
+app.mount("/ws/v1/sessions", ws_app)
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+
+# Constant payloads are encoded and hashed once at import
+_ROOT_JSON = orjson.dumps(
+    {
         "name": settings.app_name,
         "version": settings.version,
         "docs": "/docs",
     }
+)
+_ROOT_ETAG = make_etag(_ROOT_JSON)
 
-
-@app.get("/api/v1")
-async def api_info():
-    """API information endpoint."""
-    return {
+_API_INFO_JSON = orjson.dumps(
+    {
         "version": "v1",
         "endpoints": {
             "sessions": "/api/v1/sessions",
+            "websocket": "/ws/v1/sessions",
             "tasks": "/api/v1/tasks",
             "discord": "/api/v1/discord",
             "health": "/health",
             "metrics": "/metrics",
         },
     }
+)
+_API_INFO_ETAG = make_etag(_API_INFO_JSON)
 
 
-# Serve test UI
-STATIC_DIR = Path(__file__).parent.parent / "static"
+@app.get("/")
+async def root(request: Request):
+    """Root endpoint."""
+    return etag_response(request, _ROOT_JSON, _ROOT_ETAG, max_age=300)
+
+
+@app.get("/api/v1")
+async def api_info(request: Request):
+    """API information endpoint."""
+    return etag_response(request, _API_INFO_JSON, _API_INFO_ETAG, max_age=300)
 
 
 @app.get("/test")
-async def test_ui():
+async def test_ui(request: Request):
     """Serve the test UI."""
-    return FileResponse(STATIC_DIR / "index.html")
+    test_html = getattr(request.app.state, "test_html", None)
+    if test_html is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test UI not found")
+    return etag_response(
+        request, test_html, request.app.state.test_etag, max_age=60, media_type="text/html"
+    )
 
 
 @app.get("/api/v1/test-token")
 async def get_test_token(user_id: str = "test-user"):
     """Generate a test JWT token for the test UI. DO NOT use in production."""
-    token = create_token(user_id, expires_in=86400)  # 24 hours
+    # Sign off the event loop thread
+    token = await asyncio.to_thread(create_token, user_id, expires_in=86400)  # 24 hours
     return {"token": token, "user_id": user_id}
 
 
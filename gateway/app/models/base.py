@@ -0,0 +1,19 @@
+"""Shared Pydantic base classes."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseModel(BaseModel):
+    """Base for models built by the gateway and sent to clients.
+
+    Response models are never mutated after construction and never accept
+    client input, so they are frozen, reject unknown fields, and store enum
+    members as their plain values.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        use_enum_values=True,
+        validate_assignment=False,
+    )
@@ -1,9 +1,14 @@
 """Claude Code configuration models for plugins, MCPs, and skills."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
 
+# Shared immutable default ("*" allows every tool); tuples need no per-instance copy
+DEFAULT_ALLOWED_TOOLS: Tuple[str, ...] = ("*",)
+
 
 class MCPServerConfig(BaseModel):
     """Configuration for an MCP server."""
@@ -65,8 +70,8 @@ class ClaudeCodeConfig(BaseModel):
     )
 
     # Tools
-    allowed_tools: List[str] = Field(
-        default_factory=lambda: ["*"],
+    allowed_tools: Tuple[str, ...] = Field(
+        default=DEFAULT_ALLOWED_TOOLS,
         description="Tools to allow (* for all, or list specific tools)"
     )
 
@@ -105,16 +110,20 @@ class ClaudeCodeConfig(BaseModel):
 
     def to_claude_args(self) -> List[str]:
         """Convert configuration to Claude Code CLI arguments."""
+        return list(_build_claude_args(self.model_dump_json()))
+
+    def _build_args(self) -> List[str]:
+        """Build CLI arguments from scratch (see to_claude_args)."""
         args = []
 
         # MCP servers
         if self.mcp_servers:
-            import json
+            # Unset fields are dropped by pydantic-core rather than a Python filter
             mcp_config = {"mcpServers": {
-                name: {k: v for k, v in server.model_dump().items() if v}
+                name: server.model_dump(exclude_none=True, exclude_defaults=True)
                 for name, server in self.mcp_servers.items()
             }}
-            args.extend(["--mcp-config", json.dumps(mcp_config)])
+            args.extend(["--mcp-config", orjson.dumps(mcp_config).decode()])
 
         # Plugin directories
         for plugin_dir in self.plugin_dirs:
@@ -125,7 +134,7 @@ class ClaudeCodeConfig(BaseModel):
             args.extend(["--model", self.model])
 
         # Tools
-        if self.allowed_tools and self.allowed_tools != ["*"]:
+        if self.allowed_tools and self.allowed_tools != DEFAULT_ALLOWED_TOOLS:
             args.extend(["--allowed-tools", ",".join(self.allowed_tools)])
 
         if self.disallowed_tools:
@@ -140,8 +149,7 @@ class ClaudeCodeConfig(BaseModel):
 
         # Agents
         if self.custom_agents:
-            import json
-            args.extend(["--agents", json.dumps(self.custom_agents)])
+            args.extend(["--agents", orjson.dumps(self.custom_agents).decode()])
 
         # Skills
         if not self.skills_enabled:
@@ -160,10 +168,16 @@ class ClaudeCodeConfig(BaseModel):
         return args
 
 
+@lru_cache(maxsize=256)
+def _build_claude_args(config_json: str) -> tuple[str, ...]:
+    """Build CLI arguments for a serialized config, cached by content."""
+    return tuple(ClaudeCodeConfig.model_validate_json(config_json)._build_args())
+
+
 class SessionClaudeConfig(BaseModel):
     """Configuration passed when creating a session."""
 
-    allowed_tools: List[str] = Field(default_factory=lambda: ["*"])
+    allowed_tools: Tuple[str, ...] = DEFAULT_ALLOWED_TOOLS
     max_turns: int = 100
     timeout_seconds: int = 3600
 
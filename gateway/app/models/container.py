@@ -6,6 +6,8 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel
 
+from app.models.base import ResponseModel
+
 
 class ContainerStatus(str, Enum):
     """Container status enum."""
@@ -16,7 +18,7 @@ class ContainerStatus(str, Enum):
     FAILED = "failed"
 
 
-class ContainerInfo(BaseModel):
+class ContainerInfo(ResponseModel):
     """Container information."""
 
     container_id: str
@@ -27,7 +29,7 @@ class ContainerInfo(BaseModel):
     stopped_at: Optional[datetime] = None
 
 
-class ContainerStats(BaseModel):
+class ContainerStats(ResponseModel):
     """Container resource statistics."""
 
     cpu_percent: float = 0.0
@@ -54,7 +56,7 @@ class SpawnWorkspaceMode(str, Enum):
     EPHEMERAL = "ephemeral"
 
 
-class SpawnResponse(BaseModel):
+class SpawnResponse(ResponseModel):
     """Response for spawn operations."""
 
     child_session_id: str
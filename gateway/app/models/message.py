@@ -4,8 +4,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
+import msgspec
 from pydantic import BaseModel, Field
 
+from app.models.base import ResponseModel
+
 
 class MessageStatus(str, Enum):
     """Message processing status."""
@@ -23,21 +26,21 @@ class ChatRequest(BaseModel):
     timeout_seconds: Optional[int] = None
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(ResponseModel):
     """Response for chat operations."""
 
     message_id: str
     status: MessageStatus
 
 
-class UsageInfo(BaseModel):
+class UsageInfo(ResponseModel):
     """Token usage information."""
 
     input_tokens: int = 0
     output_tokens: int = 0
 
 
-class ChatResult(BaseModel):
+class ChatResult(ResponseModel):
     """Complete chat result."""
 
     message_id: str
@@ -49,7 +52,7 @@ class ChatResult(BaseModel):
     usage: UsageInfo = Field(default_factory=UsageInfo)
 
 
-class MessageDetail(BaseModel):
+class MessageDetail(ResponseModel):
     """Detailed message information."""
 
     message_id: str
@@ -72,6 +75,7 @@ class WSMessageType(str, Enum):
     SYSTEM = "system"
     CHILD_RESULT = "child_result"
     ERROR = "error"
+    BATCH = "batch"
 
 
 class WSClientMessage(BaseModel):
@@ -81,16 +85,50 @@ class WSClientMessage(BaseModel):
     prompt: Optional[str] = None
 
 
-class WSServerMessage(BaseModel):
-    """Message to WebSocket client."""
+class WSClientMessageFast(msgspec.Struct):
+    """Wire format of WSClientMessage, decoded directly by msgspec."""
 
-    type: WSMessageType
-    message: Optional[Dict[str, Any]] = None
-    tool: Optional[str] = None
-    input: Optional[Dict[str, Any]] = None
-    subtype: Optional[str] = None
-    result: Optional[str] = None
-    usage: Optional[UsageInfo] = None
-    event: Optional[str] = None
+    type: str
+    prompt: Optional[str] = None
+
+
+# Server -> client frames, encoded directly by the stream endpoint; these
+# structs are the schema, and each tag is written as the "type" field.
+# "assistant" and "tool_use" frames are Claude Code output forwarded as is,
+# and ?batch=1 wraps several frames as {"type": "batch", "messages": [...]}
+
+
+class _WSFrame(msgspec.Struct, tag_field="type", omit_defaults=True):
+    """Base for tagged outbound frames."""
+
+
+class WSResultFrame(_WSFrame, tag=WSMessageType.RESULT.value):
+    """Final result of a prompt."""
+
+    subtype: str
+    result: Any = None
+    usage: Optional[Dict[str, Any]] = None
+
+
+class WSSystemFrame(_WSFrame, tag=WSMessageType.SYSTEM.value):
+    """Gateway lifecycle event."""
+
+    event: str
     data: Optional[Dict[str, Any]] = None
+
+
+class WSChildResultFrame(_WSFrame, tag=WSMessageType.CHILD_RESULT.value):
+    """Result reported by a child session."""
+
     child_session_id: Optional[str] = None
+    result: Any = None
+
+
+class WSErrorFrame(_WSFrame, tag=WSMessageType.ERROR.value):
+    """Error raised while streaming."""
+
+    data: Dict[str, Any]
+
+
+class WSPongFrame(_WSFrame, tag=WSMessageType.PONG.value):
+    """Reply to a client ping."""
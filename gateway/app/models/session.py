@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from app.models.claude_config import ClaudeCodeConfig
+from app.models.base import ResponseModel
+from app.models.claude_config import DEFAULT_ALLOWED_TOOLS, ClaudeCodeConfig
 
 
 class SessionStatus(str, Enum):
@@ -41,7 +42,7 @@ class SessionConfig(BaseModel):
     timeout_seconds: int = 3600
     model: str = "opus-4"
     system_prompt: Optional[str] = None
-    allowed_tools: List[str] = Field(default_factory=lambda: ["*"])
+    allowed_tools: Tuple[str, ...] = DEFAULT_ALLOWED_TOOLS
     mcp_servers: Dict[str, Any] = Field(default_factory=dict)
     max_turns: int = 100
 
@@ -69,7 +70,7 @@ class SessionCreate(BaseModel):
     parent_session_id: Optional[str] = None
 
 
-class SessionResponse(BaseModel):
+class SessionResponse(ResponseModel):
     """Response for session operations."""
 
     session_id: str
@@ -79,7 +80,7 @@ class SessionResponse(BaseModel):
     websocket_url: Optional[str] = None
 
 
-class SessionDetail(BaseModel):
+class SessionDetail(ResponseModel):
     """Detailed session information."""
 
     session_id: str
@@ -92,7 +93,7 @@ class SessionDetail(BaseModel):
     total_turns: int = 0
 
 
-class SessionList(BaseModel):
+class SessionList(ResponseModel):
     """Paginated list of sessions."""
 
     sessions: List[SessionDetail]
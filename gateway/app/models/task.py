@@ -2,9 +2,17 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+from app.models.base import ResponseModel
+
+# Lowercase slug used for task and template names; validated by pydantic-core's
+# Rust regex engine (linear time, no backtracking)
+SlugName = Annotated[
+    str, StringConstraints(min_length=1, max_length=128, pattern=r"^[a-z0-9-]+$")
+]
 
 
 class TaskStatus(str, Enum):
@@ -42,7 +50,7 @@ class TaskConfig(BaseModel):
 class TaskCreate(BaseModel):
     """Request body for creating a task."""
 
-    task_name: str = Field(..., min_length=1, max_length=255, pattern="^[a-z0-9-]+$")
+    task_name: SlugName
     task_type: str = Field(..., min_length=1, max_length=50)
     description: Optional[str] = None
     template_prompt: str = Field(..., min_length=1)
@@ -86,9 +94,11 @@ class TaskStart(BaseModel):
     force: bool = Field(default=False, description="Force start even if already running")
 
 
-class TaskResponse(BaseModel):
+class TaskResponse(ResponseModel):
     """Response for task operations."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     task_name: str
     task_type: str
@@ -113,7 +123,7 @@ class TaskResponse(BaseModel):
     updated_at: datetime
 
 
-class TaskRunResponse(BaseModel):
+class TaskRunResponse(ResponseModel):
     """Response for task run operations."""
 
     id: str
@@ -138,7 +148,7 @@ class TaskRunResponse(BaseModel):
     created_at: datetime
 
 
-class TaskListResponse(BaseModel):
+class TaskListResponse(ResponseModel):
     """Paginated list of tasks."""
 
     tasks: List[TaskResponse]
@@ -147,7 +157,7 @@ class TaskListResponse(BaseModel):
     offset: int
 
 
-class TaskHistoryResponse(BaseModel):
+class TaskHistoryResponse(ResponseModel):
     """Task run history."""
 
     task_name: str
@@ -160,7 +170,7 @@ class TaskHistoryResponse(BaseModel):
 class TaskTemplateCreate(BaseModel):
     """Request body for creating a task template."""
 
-    template_name: str = Field(..., min_length=1, max_length=255, pattern="^[a-z0-9-]+$")
+    template_name: SlugName
     template_type: str = Field(..., min_length=1, max_length=50)
     description: Optional[str] = None
     template_prompt: str = Field(..., min_length=1)
@@ -170,7 +180,7 @@ class TaskTemplateCreate(BaseModel):
     is_public: bool = Field(default=False)
 
 
-class TaskTemplateResponse(BaseModel):
+class TaskTemplateResponse(ResponseModel):
     """Response for task template operations."""
 
     id: str
@@ -196,7 +206,7 @@ class TaskDependencyCreate(BaseModel):
     required: bool = Field(default=True, description="Must succeed (not just complete)")
 
 
-class TaskDependencyResponse(BaseModel):
+class TaskDependencyResponse(ResponseModel):
     """Response for task dependency."""
 
     id: str
@@ -208,7 +218,7 @@ class TaskDependencyResponse(BaseModel):
     created_at: datetime
 
 
-class TaskMetrics(BaseModel):
+class TaskMetrics(ResponseModel):
     """Task performance metrics."""
 
     task_name: str
@@ -224,7 +234,7 @@ class TaskMetrics(BaseModel):
     next_run_at: Optional[datetime]
 
 
-class TaskStatusInfo(BaseModel):
+class TaskStatusInfo(ResponseModel):
     """Detailed task status information."""
 
     task: TaskResponse
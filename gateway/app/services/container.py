@@ -1,11 +1,21 @@
 """Container management service using aiodocker."""
 
 import asyncio
+import functools
+import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import aiodocker
+import aiohttp
+import msgspec
+import orjson
+from aiodocker.containers import DockerContainer
+from aiodocker.utils import parse_result
+from multidict import CIMultiDict
 
 from app.core.config import get_settings
 from app.models.container import ContainerInfo, ContainerStatus
@@ -13,24 +23,179 @@ from app.models.container import ContainerInfo, ContainerStatus
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Docker State.Status -> session container status
+_STATUS_MAP = {
+    "created": ContainerStatus.CREATING,
+    "running": ContainerStatus.RUNNING,
+    "paused": ContainerStatus.RUNNING,
+    "restarting": ContainerStatus.RUNNING,
+    "exited": ContainerStatus.STOPPED,
+    "dead": ContainerStatus.FAILED,
+}
+
+# Shared by every wait_for_startup subscriber (aiodocker runs one events stream)
+_START_EVENT_FILTERS = json.dumps({"type": ["container"], "event": ["start", "die"]})
+
+# Appended to exec output cut off at max_exec_output_bytes
+_EXEC_TRUNCATED_MARKER = "\n[output truncated at {limit} bytes]"
+
+# Status polls within this window share one inspect
+_STATUS_CACHE_TTL = 0.1
+
+
+def _retry_once(method):
+    """Retry a Docker call once after a connection error.
+
+    The Docker client is long-lived, so a dockerd restart leaves stale
+    keep-alive sockets in its pool; the first call on one fails and aiohttp
+    reconnects on the next attempt. The failed request may still have reached
+    dockerd, so only apply this to calls that are safe to repeat: reads, and
+    start/stop/remove of a single container.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await method(*args, **kwargs)
+        except aiohttp.ClientConnectionError as e:
+            logger.warning(f"Docker connection error in {method.__name__}, retrying: {e}")
+            return await method(*args, **kwargs)
+
+    return wrapper
+
+
+class _HostConfig(msgspec.Struct, frozen=True, rename="pascal"):
+    """HostConfig section of a container create request."""
+
+    network_mode: str
+    memory: int
+    memory_reservation: int
+    nano_cpus: int
+    binds: tuple[str, ...] = ()
+
+
+class _ContainerConfig(msgspec.Struct, frozen=True, rename="pascal"):
+    """Body of a container create request, encoded straight to JSON bytes."""
+
+    image: str
+    env: list[str]
+    labels: Dict[str, str]
+    host_config: _HostConfig
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_dir_cached(path: str, bucket: int) -> bool:
+    """os.path.isdir memoized per `bucket` (a 5 s time slot)."""
+    return os.path.isdir(path)
+
+
+def _workspace_exists(path: str) -> bool:
+    """Check a workspace directory, re-statting at most every 5 seconds."""
+    return _is_dir_cached(path, int(time.monotonic() // 5))
+
+
+class _Docker(aiodocker.Docker):
+    """aiodocker client that decodes JSON API bodies with orjson and encodes
+    request bodies with msgspec.
+
+    Only _query_json (inspect, list, create, ...) is overridden; log, exec
+    and event streams keep aiodocker's own handling.
+    """
+
+    async def _query_json(self, path, method="GET", *, data=None, headers=None, **kwargs):
+        _headers = CIMultiDict(headers or {})
+        if "Content-Type" not in _headers:
+            _headers["Content-Type"] = "application/json"
+        if data is not None and not isinstance(data, (str, bytes)):
+            data = msgspec.json.encode(data)
+        async with self._query(path, method, data=data, headers=_headers, **kwargs) as response:
+            if response.content_type != "application/json":
+                return await parse_result(response)
+            body = await response.read()
+            return orjson.loads(body) if body.strip() else None
+
 
 class ContainerManager:
     """Manages Docker containers for Claude Code sessions."""
 
     def __init__(self):
         self._docker: Optional[aiodocker.Docker] = None
+        self._docker_lock = asyncio.Lock()
+        # Bounds concurrent inspects so bulk paths don't drain the connector pool
+        self._inspect_sem = asyncio.Semaphore(16)
+        # Concurrent creates are coalesced and submitted to dockerd together
+        self._create_queue: Optional[asyncio.Queue] = None
+        self._create_batcher: Optional[asyncio.Task] = None
+        self._status_cache: dict[str, tuple[float, ContainerStatus]] = {}
+        # Resource limits are static config, parsed once
+        self._mem_limit_bytes = self._parse_memory(settings.container_memory_limit)
+        self._mem_reservation_bytes = self._parse_memory(
+            settings.container_memory_reservation
+        )
+        self._nano_cpus = int(float(settings.container_cpu_limit) * 1e9)
+        # Static HostConfig fields; create_container copies this per call
+        self._host_config_template = _HostConfig(
+            network_mode=settings.container_network,
+            memory=self._mem_limit_bytes,
+            memory_reservation=self._mem_reservation_bytes,
+            nano_cpus=self._nano_cpus,
+        )
 
     async def _get_docker(self) -> aiodocker.Docker:
-        """Get or create Docker client."""
-        if self._docker is None:
-            self._docker = aiodocker.Docker()
+        """Get or create the shared Docker client."""
+        if self._docker is not None:
+            return self._docker
+        # Concurrent first calls must not each open their own client session
+        async with self._docker_lock:
+            if self._docker is None:
+                self._docker = self._create_docker()
         return self._docker
 
+    @staticmethod
+    def _create_docker() -> aiodocker.Docker:
+        """Create a Docker client sized for concurrent session operations."""
+        if not settings.docker_host.startswith("unix://"):
+            return _Docker(url=settings.docker_host)
+
+        # aiohttp's default connector would queue bursts of parallel calls
+        connector = aiohttp.UnixConnector(
+            path=settings.docker_host[len("unix://"):],
+            limit=settings.docker_pool_size,
+            limit_per_host=settings.docker_pool_size,
+        )
+        # "localhost" is only used for URL composition over the socket
+        return _Docker(url="unix://localhost", connector=connector)
+
+    async def warm_up(self) -> None:
+        """Open the shared client and check the session image before the first session."""
+        try:
+            docker = await self._get_docker()
+            await docker.images.inspect(settings.container_image)
+            logger.info(f"Docker client ready, image {settings.container_image} present")
+        except aiodocker.exceptions.DockerError as e:
+            logger.warning(f"Session image {settings.container_image} unavailable: {e}")
+        except Exception as e:
+            logger.warning(f"Docker warm-up failed: {e}")
+
     async def close(self) -> None:
         """Close Docker client."""
-        if self._docker:
-            await self._docker.close()
-            self._docker = None
+        if self._create_batcher is not None:
+            self._create_batcher.cancel()
+            try:
+                await self._create_batcher
+            except asyncio.CancelledError:
+                pass
+            self._create_batcher = None
+            self._create_queue = None
+
+        async with self._docker_lock:
+            if self._docker:
+                await self._docker.events.stop()
+                await self._docker.close()
+                # A caller-supplied connector is not closed by Docker.close()
+                if not self._docker._owns_connector:
+                    await self._docker.connector.close()
+                self._docker = None
 
     async def create_container(
         self,
@@ -43,6 +208,73 @@ class ContainerManager:
     ) -> ContainerInfo:
         """Create a new container for a Claude Code session.
 
+        See _create for the arguments.
+        """
+        container, created_at = await self._create(
+            session_id,
+            workspace_path,
+            environment,
+            claude_config_path,
+            claude_credentials_path,
+            parent_workspace_path,
+        )
+        return ContainerInfo(
+            container_id=container.id,
+            status=ContainerStatus.CREATING,
+            session_id=session_id,
+            created_at=created_at,
+        )
+
+    async def launch(
+        self,
+        session_id: str,
+        workspace_path: str,
+        environment: Dict[str, str],
+        on_created: Optional[Callable[[ContainerInfo], Awaitable[None]]] = None,
+        **create_kwargs: Any,
+    ) -> ContainerInfo:
+        """Create, start and wait for a session container.
+
+        on_created runs between create and start (e.g. to record the container
+        id). The handle returned by create is reused for start, so no lookup is
+        made between the steps.
+        """
+        container, created_at = await self._create(
+            session_id, workspace_path, environment, **create_kwargs
+        )
+        if on_created is not None:
+            await on_created(
+                ContainerInfo(
+                    container_id=container.id,
+                    status=ContainerStatus.CREATING,
+                    session_id=session_id,
+                    created_at=created_at,
+                )
+            )
+
+        await container.start()
+        logger.info(f"Started container {container.id}")
+
+        started = await self.wait_for_startup(container.id)
+        return ContainerInfo(
+            container_id=container.id,
+            status=ContainerStatus.RUNNING if started else ContainerStatus.FAILED,
+            session_id=session_id,
+            created_at=created_at,
+            started_at=datetime.now(timezone.utc) if started else None,
+        )
+
+    async def _create(
+        self,
+        session_id: str,
+        workspace_path: str,
+        environment: Dict[str, str],
+        claude_config_path: Optional[str] = None,
+        claude_credentials_path: Optional[str] = None,
+        parent_workspace_path: Optional[str] = None,
+    ) -> tuple[DockerContainer, datetime]:
+        """Create a session container and return its handle and creation time.
+
         Args:
             session_id: Unique session identifier
             workspace_path: Path to the workspace directory
@@ -53,73 +285,151 @@ class ContainerManager:
                                    The child's workspace will be mounted so parent
                                    can access it at /workspace/children/<session_id>/
         """
+        # Reject a bad workspace before the dockerd round trip. The Claude
+        # config paths are host paths resolved by dockerd, not visible here
+        if not _workspace_exists(workspace_path):
+            raise ValueError(f"Workspace path does not exist: {workspace_path}")
+
         docker = await self._get_docker()
 
-        # Build container configuration
-        config = {
-            "Image": settings.container_image,
-            "Env": [f"{k}={v}" for k, v in environment.items()],
-            "Labels": {
-                "cc-docker.session_id": session_id,
-                "cc-docker.created_at": datetime.utcnow().isoformat(),
-                "cc-docker.parent_workspace": parent_workspace_path or "",
-            },
-            "HostConfig": {
-                "Binds": [
-                    f"{workspace_path}:/workspace",
-                ],
-                "NetworkMode": settings.container_network,
-                "Memory": self._parse_memory(settings.container_memory_limit),
-                "MemoryReservation": self._parse_memory(
-                    settings.container_memory_reservation
-                ),
-                "NanoCpus": int(float(settings.container_cpu_limit) * 1e9),
-            },
-        }
+        binds = [f"{workspace_path}:/workspace"]
 
         # Add Claude config mount if available (mount to non-root user's home)
         # Note: Read-write needed because Claude writes debug logs
         if claude_config_path:
-            config["HostConfig"]["Binds"].append(
-                f"{claude_config_path}:/home/claude/.claude:rw"
-            )
+            binds.append(f"{claude_config_path}:/home/claude/.claude:rw")
 
         # Add Claude credentials mount if available
         if claude_credentials_path:
-            config["HostConfig"]["Binds"].append(
+            binds.append(
                 f"{claude_credentials_path}:/home/claude/.claude/.credentials.json:ro"
             )
 
+        now = datetime.now(timezone.utc)
+
+        # Build container configuration; the template is copied, never mutated
+        config = _ContainerConfig(
+            image=settings.container_image,
+            env=[f"{k}={v}" for k, v in environment.items()],
+            labels={
+                "cc-docker.session_id": session_id,
+                "cc-docker.created_at": now.isoformat(),
+                "cc-docker.parent_workspace": parent_workspace_path or "",
+            },
+            host_config=msgspec.structs.replace(
+                self._host_config_template, binds=tuple(binds)
+            ),
+        )
+
         logger.info(f"Creating container for session {session_id}")
 
         try:
-            container = await docker.containers.create(
-                config=config,
-                name=f"cc-docker-{session_id}",
-            )
-
-            return ContainerInfo(
-                container_id=container.id,
-                status=ContainerStatus.CREATING,
-                session_id=session_id,
-                created_at=datetime.utcnow(),
+            container = await self._submit_create(
+                docker, config, f"cc-docker-{session_id}"
             )
+            return container, now
         except Exception as e:
             logger.error(f"Failed to create container: {e}")
             raise
 
+    @staticmethod
+    async def _post_create(
+        docker: aiodocker.Docker, config: _ContainerConfig, name: str
+    ) -> DockerContainer:
+        """POST containers/create with the config encoded by msgspec.
+
+        Bypasses containers.create(), which would re-serialize the body with
+        stdlib json.
+        """
+        data = await docker._query_json(
+            "containers/create",
+            method="POST",
+            data=msgspec.json.encode(config),
+            params={"name": name},
+        )
+        return DockerContainer(docker, id=data["Id"])
+
+    async def _submit_create(
+        self, docker: aiodocker.Docker, config: _ContainerConfig, name: str
+    ) -> DockerContainer:
+        """Create a container, batched with other creates arriving in the same window."""
+        if settings.create_batch_size <= 1:
+            return await self._post_create(docker, config, name)
+
+        if self._create_batcher is None:
+            self._create_queue = asyncio.Queue()
+            self._create_batcher = asyncio.create_task(self._run_create_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._create_queue.put((config, name, future))
+        return await future
+
+    async def _run_create_batches(self) -> None:
+        """Drain queued creates in batches and resolve each caller's future."""
+        loop = asyncio.get_running_loop()
+        window = settings.create_batch_window_ms / 1000
+        batch: list = []
+        try:
+            while True:
+                batch = [await self._create_queue.get()]
+                deadline = loop.time() + window
+                while len(batch) < settings.create_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._create_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    docker = await self._get_docker()
+                    results = await asyncio.gather(
+                        *(
+                            self._post_create(docker, config, name)
+                            for config, name, _ in batch
+                        ),
+                        return_exceptions=True,
+                    )
+                except Exception as e:
+                    results = [e] * len(batch)
+
+                for (_, _, future), result in zip(batch, results):
+                    if future.done():
+                        # Caller was cancelled while waiting
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        except asyncio.CancelledError:
+            # Nobody is left to resolve the batch in flight or the queued
+            # creates, so fail them rather than leave their callers hanging
+            while not self._create_queue.empty():
+                batch.append(self._create_queue.get_nowait())
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("Container manager closed before the create completed")
+                    )
+            raise
+
+    @_retry_once
     async def start_container(self, container_id: str) -> None:
         """Start a container."""
         docker = await self._get_docker()
-        container = await docker.containers.get(container_id)
+        container = docker.containers.container(container_id)
+        self._status_cache.pop(container_id, None)
         await container.start()
         logger.info(f"Started container {container_id}")
 
+    @_retry_once
     async def stop_container(self, container_id: str, timeout: int = 10) -> None:
         """Stop a container gracefully."""
         docker = await self._get_docker()
         try:
-            container = await docker.containers.get(container_id)
+            container = docker.containers.container(container_id)
+            self._status_cache.pop(container_id, None)
             await container.stop(t=timeout)
             logger.info(f"Stopped container {container_id}")
         except aiodocker.exceptions.DockerError as e:
@@ -128,11 +438,41 @@ class ContainerManager:
             else:
                 raise
 
+    async def bulk_stop(self, session_ids: list[str], timeout: int = 10) -> None:
+        """Stop the running containers of several sessions concurrently."""
+        docker = await self._get_docker()
+        # Docker ANDs repeated label filters, so list every session container
+        # once and match the wanted ids locally
+        wanted = set(session_ids)
+        containers = [
+            container
+            for container in await docker.containers.list(
+                filters={"label": ["cc-docker.session_id"]}
+            )
+            if container._container["Labels"].get("cc-docker.session_id") in wanted
+        ]
+
+        for container in containers:
+            self._status_cache.pop(container.id, None)
+        results = await asyncio.gather(
+            *(container.stop(t=timeout) for container in containers),
+            return_exceptions=True,
+        )
+        for container, result in zip(containers, results):
+            if isinstance(result, aiodocker.exceptions.DockerError) and "404" in str(result):
+                logger.warning(f"Container {container.id} not found")
+            elif isinstance(result, BaseException):
+                logger.error(f"Failed to stop container {container.id}: {result}")
+            else:
+                logger.info(f"Stopped container {container.id}")
+
+    @_retry_once
     async def remove_container(self, container_id: str, force: bool = False) -> None:
         """Remove a container."""
         docker = await self._get_docker()
         try:
-            container = await docker.containers.get(container_id)
+            container = docker.containers.container(container_id)
+            self._status_cache.pop(container_id, None)
             await container.delete(force=force)
             logger.info(f"Removed container {container_id}")
         except aiodocker.exceptions.DockerError as e:
@@ -141,97 +481,198 @@ class ContainerManager:
             else:
                 raise
 
+    @_retry_once
     async def get_container_status(self, container_id: str) -> ContainerStatus:
         """Get container status."""
+        now = time.monotonic()
+        cached = self._status_cache.get(container_id)
+        if cached is not None and now - cached[0] < _STATUS_CACHE_TTL:
+            return cached[1]
+
         docker = await self._get_docker()
         try:
-            container = await docker.containers.get(container_id)
-            info = await container.show()
-            state = info["State"]["Status"]
-
-            status_map = {
-                "created": ContainerStatus.CREATING,
-                "running": ContainerStatus.RUNNING,
-                "paused": ContainerStatus.RUNNING,
-                "restarting": ContainerStatus.RUNNING,
-                "exited": ContainerStatus.STOPPED,
-                "dead": ContainerStatus.FAILED,
-            }
-            return status_map.get(state, ContainerStatus.FAILED)
+            # containers.get() is itself the inspect call
+            info = (await docker.containers.get(container_id))._container
         except aiodocker.exceptions.DockerError:
             return ContainerStatus.FAILED
 
+        status = _STATUS_MAP.get(info["State"]["Status"], ContainerStatus.FAILED)
+        if len(self._status_cache) >= 1024:
+            # Drop expired entries so containers never seen again don't pile up
+            self._status_cache = {
+                cid: entry
+                for cid, entry in self._status_cache.items()
+                if now - entry[0] < _STATUS_CACHE_TTL
+            }
+        self._status_cache[container_id] = (now, status)
+        return status
+
+    @_retry_once
     async def get_container_logs(
-        self, container_id: str, tail: int = 100
+        self, container_id: str, tail: int = 100, since: Optional[int] = None
     ) -> str:
-        """Get container logs."""
+        """Get container logs.
+
+        Pass the Unix time of the previous poll as `since` to fetch only new
+        lines. Output is capped at max_exec_output_bytes.
+        """
         docker = await self._get_docker()
+        params: Dict[str, Any] = {"stdout": True, "stderr": True, "tail": tail}
+        if since is not None:
+            params["since"] = since
+
+        # Session containers run without a TTY, so the body is Docker's
+        # multiplexed stream: 8-byte header (stream, 0, 0, 0, size) + payload
+        buf = bytearray()
+        limit = settings.max_exec_output_bytes
         try:
-            container = await docker.containers.get(container_id)
-            logs = await container.log(stdout=True, stderr=True, tail=tail)
-            return "".join(logs)
+            async with docker._query(
+                f"containers/{container_id}/logs", params=params
+            ) as response:
+                reader = response.content
+                while len(buf) < limit:
+                    try:
+                        header = await reader.readexactly(8)
+                    except asyncio.IncompleteReadError:
+                        break
+                    size = int.from_bytes(header[4:], "big")
+                    buf.extend(await reader.readexactly(size))
         except aiodocker.exceptions.DockerError:
             return ""
 
+        return buf[:limit].decode("utf-8", errors="replace")
+
     async def exec_in_container(
         self, container_id: str, cmd: list[str]
     ) -> tuple[int, str]:
-        """Execute a command in a running container."""
+        """Execute a command in a running container.
+
+        Output beyond max_exec_output_bytes is dropped and a truncation marker
+        is appended.
+        """
         docker = await self._get_docker()
-        container = await docker.containers.get(container_id)
+        container = docker.containers.container(container_id)
 
         exec_obj = await container.exec(cmd, stdout=True, stderr=True)
         stream = exec_obj.start()
-        output = []
+        # Raw bytes are decoded once so multibyte characters split across
+        # chunks survive
+        buf = bytearray()
+        limit = settings.max_exec_output_bytes
+        truncated = False
 
         async with stream:
+            # Keep draining past the limit so the command runs to completion
+            # and its exit code is available
             while True:
                 msg = await stream.read_out()
                 if msg is None:
                     break
-                output.append(msg.data.decode())
+                room = limit - len(buf)
+                if len(msg.data) > room:
+                    truncated = True
+                if room > 0:
+                    buf.extend(msg.data[:room])
+
+        output = buf.decode("utf-8", errors="replace")
+        if truncated:
+            output += _EXEC_TRUNCATED_MARKER.format(limit=limit)
 
         inspect = await exec_obj.inspect()
-        return inspect["ExitCode"], "".join(output)
+        return inspect["ExitCode"], output
 
+    @_retry_once
     async def list_session_containers(self) -> list[ContainerInfo]:
         """List all cc-docker containers."""
         docker = await self._get_docker()
+        # The list endpoint already carries state, labels and creation time,
+        # so no per-container inspect is needed
         containers = await docker.containers.list(
             filters={"label": ["cc-docker.session_id"]}
         )
 
-        result = []
-        for container in containers:
-            info = await container.show()
-            result.append(
-                ContainerInfo(
-                    container_id=container.id,
-                    status=await self.get_container_status(container.id),
-                    session_id=info["Config"]["Labels"]["cc-docker.session_id"],
-                    created_at=datetime.fromisoformat(
-                        info["Created"].replace("Z", "+00:00")
-                    ),
-                )
+        return [
+            ContainerInfo(
+                container_id=container.id,
+                status=_STATUS_MAP.get(
+                    container._container.get("State"), ContainerStatus.FAILED
+                ),
+                session_id=container._container["Labels"]["cc-docker.session_id"],
+                created_at=datetime.fromtimestamp(
+                    container._container["Created"], timezone.utc
+                ),
             )
-        return result
+            for container in containers
+        ]
+
+    @_retry_once
+    async def describe(self, container_id: str) -> Dict[str, Any]:
+        """Get the full inspect payload for a container."""
+        docker = await self._get_docker()
+        container = await docker.containers.get(container_id)
+        return container._container
+
+    async def _bounded_show(self, container) -> Dict[str, Any]:
+        """Inspect a container, limited by the inspect semaphore."""
+        async with self._inspect_sem:
+            return await container.show()
+
+    @_retry_once
+    async def describe_many(self, container_ids: list[str]) -> list[Dict[str, Any]]:
+        """Get inspect payloads for several containers concurrently."""
+        docker = await self._get_docker()
+        return await asyncio.gather(
+            *(
+                self._bounded_show(docker.containers.container(container_id))
+                for container_id in container_ids
+            )
+        )
 
     async def wait_for_startup(
         self, container_id: str, timeout: int = None
     ) -> bool:
-        """Wait for container to start."""
+        """Wait for container to start, driven by the Docker event stream."""
         timeout = timeout or settings.startup_timeout
-        start_time = asyncio.get_event_loop().time()
+        docker = await self._get_docker()
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
+        # The shared events task ends if dockerd drops the stream; start a new one
+        if docker.events.task is not None and docker.events.task.done():
+            docker.events.task = None
+        subscriber = docker.events.subscribe(filters=_START_EVENT_FILTERS)
+
+        try:
+            # Subscribe first, then inspect once, so a start that already
+            # happened is not missed
             status = await self.get_container_status(container_id)
             if status == ContainerStatus.RUNNING:
                 return True
             if status == ContainerStatus.FAILED:
                 return False
-            await asyncio.sleep(0.5)
 
-        return False
+            return await asyncio.wait_for(
+                self._await_start_event(subscriber, container_id), timeout
+            )
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            del subscriber
+
+    async def _await_start_event(self, subscriber, container_id: str) -> bool:
+        """Block until the container's start (True) or die (False) event."""
+        while True:
+            msg = await subscriber.get()
+            if msg is None:
+                # Event stream closed; fall back to a direct inspect
+                status = await self.get_container_status(container_id)
+                return status == ContainerStatus.RUNNING
+            if msg.get("Type") != "container":
+                continue
+            if msg.get("Actor", {}).get("ID") != container_id:
+                continue
+            if msg.get("Action") == "start":
+                return True
+            if msg.get("Action") == "die":
+                return False
 
     @staticmethod
     def _parse_memory(memory_str: str) -> int:
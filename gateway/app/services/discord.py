@@ -1,34 +1,105 @@
 """Discord bot service for CC-Docker."""
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import uuid4
 
 import discord
+import msgspec
 from discord import app_commands
-from discord.ext import commands, tasks
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from discord.ext import commands
+from sqlalchemy import select, update
 
 from app.core.config import get_settings
-from app.db.database import get_db_session
+from app.db.database import get_db_context
 from app.db.models import DiscordInteraction, Session as SessionModel, Task
+from app.models.task import TaskConfig, TaskCreate, TaskUpdate
+from app.services.discord_log import discord_message_log
+from app.services.task import TaskService
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Upper bound for the thread and message caches
+_CACHE_SIZE = 1024
+
+# Message emoji by priority; anything other than "urgent" renders as normal
+_QUESTION_EMOJI = {"urgent": "🚨", "normal": "🤔"}
+_NOTIFY_EMOJI = {"urgent": "⚠️", "normal": "✅"}
+
+# Concurrent countdown edits, matching Discord's 5 edits per 5s channel budget
+_EDIT_CONCURRENCY = 5
+
+# Notifications waiting to be sent before post_notification applies backpressure
+_OUTBOUND_QUEUE_SIZE = 1000
+
+# How long close() waits for queued notifications to go out
+_OUTBOUND_DRAIN_TIMEOUT = 10
+
+# How long an unclaimed answer stays queued (e.g. the asking request went away)
+_RESPONSE_TTL = 3600
+
+# Extra time a question stays answerable after its last attempt would end
+_PENDING_GRACE_SECONDS = 60
+
+# Longest a question can stay pending: AskRequest allows up to 5 attempts of
+# 7200s. Older 'pending' rows were orphaned by a crash and are not loaded
+_MAX_PENDING_AGE = timedelta(seconds=5 * 7200 + _PENDING_GRACE_SECONDS)
+
+# Delay before retrying a failed load of pending questions at startup
+_SEED_RETRY_SECONDS = 5
+
+# Countdowns show exact minutes only this close to the timeout; above it they
+# step in buckets of this size, so most ticks leave the text unchanged
+_COUNTDOWN_BUCKET_MINUTES = 5
+
+
+def _display_minutes(minutes_remaining: int) -> int:
+    """Minutes to show for a countdown, rounded down to a bucket above the threshold."""
+    if minutes_remaining <= _COUNTDOWN_BUCKET_MINUTES:
+        return minutes_remaining
+    return minutes_remaining - minutes_remaining % _COUNTDOWN_BUCKET_MINUTES
+
+
+class _PendingQuestion(msgspec.Struct):
+    """In-memory copy of a pending question's row."""
+
+    id: str
+    session_id: str
+    thread_id: str
+    message_id: str
+    message: str
+    created_at: datetime  # UTC-aware
+    timeout_seconds: int
+    attempt: int
+    max_attempts: int
+    priority: str
+
+
+def response_key(session_id: str, interaction_id: str) -> str:
+    """Redis list the bot pushes an answer onto and the asking request pops."""
+    return f"session:{session_id}:discord:response:{interaction_id}"
+
+
+def response_channel(session_id: str, interaction_id: str) -> str:
+    """Pub/sub channel that wakes the asking request once an answer is queued."""
+    return f"{response_key(session_id, interaction_id)}:ready"
+
 
 class CCDiscordBot(commands.Bot):
     """Discord bot for CC-Docker interactions with slash commands."""
 
-    def __init__(self, channel_id: int, redis_client):
+    def __init__(self, channel_id: int, redis_client, scheduler=None):
         """Initialize Discord bot.
 
         Args:
             channel_id: Discord channel ID to post to
             redis_client: Redis client for pub/sub communication
+            scheduler: Running SchedulerService that /task-schedule adds jobs to
         """
         intents = discord.Intents.default()
         intents.message_content = True  # Required to read message content
@@ -39,14 +110,123 @@ class CCDiscordBot(commands.Bot):
         self.channel_id = channel_id
         self.redis = redis_client
         self.channel: Optional[discord.TextChannel] = None
-        self.update_task_started = False
         self.tree.on_error = self.on_app_command_error
+        # LRU caches so countdown edits skip get/fetch round trips; keyed by
+        # thread id and interaction id
+        self._thread_cache: OrderedDict[str, discord.Thread] = OrderedDict()
+        self._message_cache: OrderedDict[str, discord.Message] = OrderedDict()
+        # Interactions whose question message was deleted; they are not re-fetched
+        self._missing_messages: set[str] = set()
+        # Question text split around the minute count, keyed by interaction id
+        self._template_cache: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        # Minute count currently shown on each pending question
+        self._last_edit_minutes: dict[str, int] = {}
+        # Pending questions by thread and interaction id. Every question is posted
+        # by this bot, so these (seeded from the DB at startup) are authoritative
+        self._pending_by_thread: dict[str, _PendingQuestion] = {}
+        self._pending_by_id: dict[str, _PendingQuestion] = {}
+        # Countdown schedule: min-heap of (loop time due, interaction id).
+        # Answered ids leave _countdown_ids and their heap entries are skipped
+        self._countdown_heap: list[tuple[float, str]] = []
+        self._countdown_ids: set[str] = set()
+        self._countdown_wakeup = asyncio.Event()
+        self._countdown_task: Optional[asyncio.Task] = None
+        # Set once on_ready has resolved self.channel
+        self._channel_ready = asyncio.Event()
+        self._edit_sem = asyncio.Semaphore(_EDIT_CONCURRENCY)
+        # Notifications are sent in order by one worker: (session id, priority,
+        # content, future resolved once sent or None for fire-and-forget)
+        self._outbound: asyncio.Queue[
+            tuple[str, str, str, Optional[asyncio.Future]]
+        ] = asyncio.Queue(
+            maxsize=_OUTBOUND_QUEUE_SIZE
+        )
+        self._outbound_task: Optional[asyncio.Task] = None
+        # Strong references so in-flight acknowledgements aren't collected
+        self._pending_acks: set[asyncio.Task] = set()
+        # The application's scheduler, so /task-schedule jobs actually run
+        self._scheduler = scheduler
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: str, value) -> None:
+        """Insert into an LRU cache, evicting the oldest entry when full."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _track_pending(self, pending: _PendingQuestion) -> None:
+        """Index a pending question by thread and interaction id."""
+        self._pending_by_thread[pending.thread_id] = pending
+        self._pending_by_id[pending.id] = pending
+
+    def _untrack_pending(self, interaction_id: str) -> None:
+        """Forget a question that is no longer pending, including its countdown."""
+        pending = self._pending_by_id.pop(interaction_id, None)
+        if pending is not None:
+            self._pending_by_thread.pop(pending.thread_id, None)
+        self._message_cache.pop(interaction_id, None)
+        self._missing_messages.discard(interaction_id)
+        self._template_cache.pop(interaction_id, None)
+        self._last_edit_minutes.pop(interaction_id, None)
+        self._countdown_ids.discard(interaction_id)
+
+    async def _get_thread(self, thread_id: str) -> Optional[discord.Thread]:
+        """Resolve a thread from the cache, the client cache, or the API."""
+        thread = self._thread_cache.get(thread_id)
+        if thread is not None:
+            self._thread_cache.move_to_end(thread_id)
+            return thread
+
+        thread = self.channel.get_thread(int(thread_id))
+        if not thread:
+            # Try fetching if not in cache
+            try:
+                thread = await self.channel.fetch_thread(int(thread_id))
+            except discord.NotFound:
+                return None
+
+        self._cache_put(self._thread_cache, thread_id, thread)
+        return thread
 
     async def setup_hook(self):
         """Setup hook called before bot starts."""
         # Register slash commands
         await self.register_slash_commands()
 
+        self._countdown_task = asyncio.create_task(self._countdown_scheduler())
+        self._outbound_task = asyncio.create_task(self._drain_outbound())
+
+    async def close(self):
+        """Stop background work, drain pending sends and disconnect."""
+        if self._countdown_task:
+            self._countdown_task.cancel()
+            try:
+                await self._countdown_task
+            except asyncio.CancelledError:
+                pass
+            self._countdown_task = None
+        if self._outbound_task:
+            try:
+                await asyncio.wait_for(self._outbound.join(), _OUTBOUND_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._outbound.qsize()} unsent notification(s)")
+            self._outbound_task.cancel()
+            try:
+                await self._outbound_task
+            except asyncio.CancelledError:
+                pass
+            self._outbound_task = None
+            # Fail anyone still waiting on a dropped notification
+            while not self._outbound.empty():
+                *_, future = self._outbound.get_nowait()
+                if future is not None and not future.done():
+                    future.set_exception(RuntimeError("Discord bot stopped before sending"))
+        # Let in-flight acknowledgements finish while the client is connected
+        if self._pending_acks:
+            await asyncio.gather(*self._pending_acks, return_exceptions=True)
+        await super().close()
+
     async def register_slash_commands(self):
         """Register all slash commands with Discord."""
         # Task management commands
@@ -122,6 +302,15 @@ class CCDiscordBot(commands.Bot):
             return
 
         logger.info(f"Monitoring channel: #{self.channel.name} ({self.channel_id})")
+        self._channel_ready.set()
+
+        # One request for every open question thread instead of a fetch per thread
+        try:
+            for thread in await self.channel.guild.active_threads():
+                if thread.parent_id == self.channel.id:
+                    self._cache_put(self._thread_cache, str(thread.id), thread)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to prime thread cache: {e}")
 
         # Sync slash commands with Discord
         try:
@@ -130,11 +319,6 @@ class CCDiscordBot(commands.Bot):
         except Exception as e:
             logger.error(f"Failed to sync slash commands: {e}")
 
-        # Start the periodic update task
-        if not self.update_task_started:
-            self.update_countdowns.start()
-            self.update_task_started = True
-
     async def on_message(self, message: discord.Message):
         """Handle incoming messages."""
         # Ignore messages from the bot itself
@@ -146,122 +330,271 @@ class CCDiscordBot(commands.Bot):
             return
 
         # Check if this thread is tracking a question
-        thread_id = str(message.channel.id)
+        pending = self._pending_by_thread.get(str(message.channel.id))
+        if pending is None:
+            return
 
-        async for db in get_db_session():
-            try:
-                # Find the interaction for this thread
+        try:
+            async with get_db_context() as db:
+                # Claim the question and store the response
                 result = await db.execute(
-                    select(DiscordInteraction)
-                    .where(DiscordInteraction.discord_thread_id == thread_id)
+                    update(DiscordInteraction)
+                    .where(DiscordInteraction.id == pending.id)
                     .where(DiscordInteraction.status == "pending")
+                    .values(
+                        response=message.content,
+                        status="answered",
+                        answered_at=datetime.now(timezone.utc),
+                    )
+                    .returning(DiscordInteraction.id)
                 )
-                interaction = result.scalar_one_or_none()
-
-                if not interaction:
-                    return
-
-                # Store the response
-                interaction.response = message.content
-                interaction.status = "answered"
-                interaction.answered_at = datetime.utcnow()
-
-                await db.commit()
-
-                # Publish response to Redis for the waiting API call
-                response_key = f"session:{interaction.session_id}:discord:response:{interaction.id}"
-                await self.redis.set(response_key, message.content, ex=3600)  # 1 hour expiry
+                claimed = result.first() is not None
 
-                # Acknowledge in Discord
-                await message.add_reaction("✅")
-                await message.channel.send(f"✅ Response received: `{message.content[:100]}{'...' if len(message.content) > 100 else ''}`")
+        except Exception as e:
+            logger.error(f"Error handling message: {e}", exc_info=True)
+            return
 
-                logger.info(f"Response received for interaction {interaction.id}: {message.content[:50]}")
+        # No more countdown edits for this question; if it wasn't claimed it
+        # was already answered or timed out by the API side
+        self._untrack_pending(pending.id)
+        if not claimed:
+            return
+        interaction_id, session_id = pending.id, pending.session_id
 
-            except Exception as e:
-                logger.error(f"Error handling message: {e}", exc_info=True)
-            finally:
-                await db.close()
+        # Redis and Discord round trips run after the session is released
+        task = asyncio.create_task(
+            self._acknowledge_response(message, interaction_id, session_id)
+        )
+        self._pending_acks.add(task)
+        task.add_done_callback(self._pending_acks.discard)
 
-    @tasks.loop(seconds=settings.discord_update_interval)
-    async def update_countdowns(self):
-        """Periodically update countdown timers in questions."""
+    async def _acknowledge_response(
+        self, message: discord.Message, interaction_id: str, session_id: str
+    ):
+        """Publish an answer to Redis and acknowledge it in the thread."""
         try:
-            async for db in get_db_session():
-                try:
-                    # Find all pending interactions
-                    result = await db.execute(
-                        select(DiscordInteraction)
-                        .where(DiscordInteraction.status == "pending")
-                        .where(DiscordInteraction.interaction_type == "question")
-                    )
-                    interactions = result.scalars().all()
-
-                    for interaction in interactions:
-                        await self._update_countdown(interaction, db)
-
-                except Exception as e:
-                    logger.error(f"Error updating countdowns: {e}", exc_info=True)
-                finally:
-                    await db.close()
+            # Hand the answer to the waiting API call; it stays queued if the
+            # waiter is between attempts. One round trip for all three commands
+            key = response_key(session_id, interaction_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.rpush(key, message.content)
+            pipe.expire(key, _RESPONSE_TTL)
+            pipe.publish(response_channel(session_id, interaction_id), "{}")
+            await pipe.execute()
+
+            # Acknowledge in Discord
+            content = message.content
+            preview = content if len(content) <= 100 else content[:100] + "..."
+            await message.add_reaction("✅")
+            await message.channel.send(f"✅ Response received: `{preview}`")
+
+            logger.info(f"Response received for interaction {interaction_id}: {preview[:50]}")
 
         except Exception as e:
-            logger.error(f"Error in update_countdowns task: {e}", exc_info=True)
+            logger.error(f"Error acknowledging response: {e}", exc_info=True)
+
+    def _schedule_countdown(self, interaction_id: str, delay: float) -> None:
+        """Schedule the next countdown edit for a question."""
+        self._countdown_ids.add(interaction_id)
+        due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._countdown_heap, (due, interaction_id))
+        self._countdown_wakeup.set()
+
+    async def _countdown_scheduler(self):
+        """Run countdown edits as they fall due instead of polling on a fixed tick."""
+        # Edits need the channel, so nothing runs until on_ready has found it
+        await self._channel_ready.wait()
+        # A database blip at startup must not kill the scheduler for good
+        while True:
+            try:
+                await self._seed_countdowns()
+                break
+            except Exception as e:
+                logger.error(
+                    f"Failed to load pending questions (retrying in {_SEED_RETRY_SECONDS}s): {e}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(_SEED_RETRY_SECONDS)
+
+        loop = asyncio.get_running_loop()
+        while not self.is_closed():
+            # Sleep until the earliest deadline, or until a new question is scheduled
+            timeout = None
+            if self._countdown_heap:
+                timeout = max(0.0, self._countdown_heap[0][0] - loop.time())
+            self._countdown_wakeup.clear()
+            try:
+                await asyncio.wait_for(self._countdown_wakeup.wait(), timeout)
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            now = loop.time()
+            due = []
+            while self._countdown_heap and self._countdown_heap[0][0] <= now:
+                _, interaction_id = heapq.heappop(self._countdown_heap)
+                if interaction_id in self._countdown_ids:
+                    due.append(interaction_id)
+
+            if due:
+                # Failed edits are logged per question and rescheduled as usual
+                await self.update_countdowns(due)
+
+    async def _seed_countdowns(self):
+        """Index and schedule questions left pending by a previous run."""
+        async with get_db_context() as db:
+            result = await db.execute(
+                select(
+                    DiscordInteraction.id,
+                    DiscordInteraction.session_id,
+                    DiscordInteraction.discord_thread_id,
+                    DiscordInteraction.discord_message_id,
+                    DiscordInteraction.message,
+                    DiscordInteraction.created_at,
+                    DiscordInteraction.timeout_seconds,
+                    DiscordInteraction.attempt,
+                    DiscordInteraction.max_attempts,
+                    DiscordInteraction.priority,
+                )
+                .where(DiscordInteraction.status == "pending")
+                .where(DiscordInteraction.interaction_type == "question")
+                .where(DiscordInteraction.created_at >= datetime.now(timezone.utc) - _MAX_PENDING_AGE)
+                .where(DiscordInteraction.discord_thread_id.isnot(None))
+                .where(DiscordInteraction.discord_message_id.isnot(None))
+            )
+            rows = result.all()
+
+        for row in rows:
+            created = row.created_at
+            if created.tzinfo is None:
+                # SQLite drops the offset; timestamps are always stored as UTC
+                created = created.replace(tzinfo=timezone.utc)
+            self._track_pending(
+                _PendingQuestion(
+                    id=row.id,
+                    session_id=row.session_id,
+                    thread_id=row.discord_thread_id,
+                    message_id=row.discord_message_id,
+                    message=row.message,
+                    created_at=created,
+                    timeout_seconds=row.timeout_seconds,
+                    attempt=row.attempt,
+                    max_attempts=row.max_attempts,
+                    priority=row.priority,
+                )
+            )
+            self._schedule_countdown(row.id, 0)
+
+    async def update_countdowns(self, interaction_ids: list[str]):
+        """Update countdown timers for due questions and schedule their next edit."""
+        questions = []
+        for interaction_id in interaction_ids:
+            pending = self._pending_by_id.get(interaction_id)
+            if pending is None:
+                self._countdown_ids.discard(interaction_id)
+            else:
+                questions.append(pending)
+
+        # Edits are independent Discord round trips, so overlap them
+        now = datetime.now(timezone.utc)
+        results = await asyncio.gather(
+            *(self._update_countdown(q, now) for q in questions),
+            return_exceptions=True,
+        )
+        for pending, result in zip(questions, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error updating countdown for interaction {pending.id}: {result}",
+                    exc_info=result,
+                )
 
-    async def _update_countdown(self, interaction: DiscordInteraction, db: AsyncSession):
+        for pending in questions:
+            if pending.id not in self._pending_by_id:
+                # Answered while the edits were in flight
+                continue
+            elapsed_s = (now - pending.created_at).total_seconds()
+            if elapsed_s < pending.timeout_seconds:
+                self._schedule_countdown(pending.id, settings.discord_update_interval)
+                continue
+
+            # Retries reuse the thread, so the question stays answerable (with no
+            # more edits) until its last attempt has run out
+            window_s = (
+                pending.timeout_seconds * pending.max_attempts
+                + _PENDING_GRACE_SECONDS
+                - elapsed_s
+            )
+            if window_s > 0:
+                self._last_edit_minutes.pop(pending.id, None)
+                self._schedule_countdown(pending.id, window_s)
+            else:
+                self._untrack_pending(pending.id)
+
+    async def _update_countdown(self, pending: _PendingQuestion, now: datetime):
         """Update countdown for a specific interaction."""
         try:
-            # Calculate time remaining
-            now = datetime.utcnow()
-            created = interaction.created_at
-            timeout = timedelta(seconds=interaction.timeout_seconds)
-            elapsed = now - created
-            remaining = timeout - elapsed
+            # Calculate time remaining in seconds
+            elapsed_s = (now - pending.created_at).total_seconds()
+            remaining_s = pending.timeout_seconds - elapsed_s
 
             # Check if timed out
-            if remaining.total_seconds() <= 0:
+            if remaining_s <= 0:
                 # Don't update if already handled by retry logic
                 return
 
-            # Only update if message exists and significant time has passed (e.g., > 1 minute since creation)
-            if not interaction.discord_message_id or elapsed.total_seconds() < 60:
+            # Only update if significant time has passed (e.g., > 1 minute since creation)
+            if elapsed_s < 60:
                 return
 
-            # Get the thread
-            if not self.channel:
+            # Nothing to edit if the displayed minute count is unchanged
+            minutes_remaining = _display_minutes(int(remaining_s // 60))
+            if self._last_edit_minutes.get(pending.id) == minutes_remaining:
+                return
+            if pending.id in self._missing_messages:
                 return
 
-            thread = self.channel.get_thread(int(interaction.discord_thread_id))
-            if not thread:
-                # Try fetching if not in cache
+            # Get the original message
+            message = self._message_cache.get(pending.id)
+            if message is None:
+                thread = await self._get_thread(pending.thread_id)
+                if not thread:
+                    logger.warning(f"Thread {pending.thread_id} not found")
+                    return
+
                 try:
-                    thread = await self.channel.fetch_thread(int(interaction.discord_thread_id))
+                    message = await thread.fetch_message(int(pending.message_id))
                 except discord.NotFound:
-                    logger.warning(f"Thread {interaction.discord_thread_id} not found")
+                    logger.warning(f"Message {pending.message_id} not found")
+                    self._missing_messages.add(pending.id)
                     return
-
-            # Get the original message
-            try:
-                message = await thread.fetch_message(int(interaction.discord_message_id))
-            except discord.NotFound:
-                logger.warning(f"Message {interaction.discord_message_id} not found")
-                return
+                self._cache_put(self._message_cache, pending.id, message)
 
             # Update the message with new countdown
-            minutes_remaining = int(remaining.total_seconds() / 60)
-            updated_content = self._format_question_message(
-                interaction.session_id,
-                interaction.message,
-                minutes_remaining,
-                interaction.attempt,
-                interaction.max_attempts,
-                interaction.priority
-            )
+            template = self._template_cache.get(pending.id)
+            if template is None:
+                template = self._question_template(
+                    pending.session_id,
+                    pending.message,
+                    pending.attempt,
+                    pending.max_attempts,
+                    pending.priority,
+                    pending.created_at,
+                )
+                self._cache_put(self._template_cache, pending.id, template)
+            head, tail = template
+            updated_content = f"{head}{minutes_remaining}{tail}"
 
-            await message.edit(content=updated_content)
+            try:
+                async with self._edit_sem:
+                    await message.edit(content=updated_content)
+                self._last_edit_minutes[pending.id] = minutes_remaining
+            except discord.NotFound:
+                logger.warning(f"Message {pending.message_id} not found")
+                self._message_cache.pop(pending.id, None)
+                self._missing_messages.add(pending.id)
 
         except Exception as e:
-            logger.error(f"Error updating countdown for interaction {interaction.id}: {e}", exc_info=True)
+            logger.error(f"Error updating countdown for interaction {pending.id}: {e}", exc_info=True)
 
     async def post_question(
         self,
@@ -293,10 +626,15 @@ class CCDiscordBot(commands.Bot):
         # Calculate timeout in minutes for display
         minutes = int(timeout_seconds / 60)
 
-        # Format the message
-        content = self._format_question_message(
-            session_id, question, minutes, attempt, max_attempts, priority
+        # Format the message; countdown edits only swap in the minute count
+        created = datetime.now(timezone.utc)
+        template = self._question_template(
+            session_id, question, attempt, max_attempts, priority, created
         )
+        self._cache_put(self._template_cache, interaction_id, template)
+        head, tail = template
+        content = f"{head}{minutes}{tail}"
+        self._last_edit_minutes[interaction_id] = minutes
 
         # Post the message
         message = await self.channel.send(content)
@@ -307,6 +645,23 @@ class CCDiscordBot(commands.Bot):
             thread_name += f" (Retry {attempt})"
 
         thread = await message.create_thread(name=thread_name[:100])  # Discord limit
+        self._cache_put(self._thread_cache, str(thread.id), thread)
+        self._cache_put(self._message_cache, interaction_id, message)
+        self._track_pending(
+            _PendingQuestion(
+                id=interaction_id,
+                session_id=session_id,
+                thread_id=str(thread.id),
+                message_id=str(message.id),
+                message=question,
+                created_at=created,
+                timeout_seconds=timeout_seconds,
+                attempt=attempt,
+                max_attempts=max_attempts,
+                priority=priority,
+            )
+        )
+        self._schedule_countdown(interaction_id, settings.discord_update_interval)
 
         # Post instructions in the thread
         await thread.send(
@@ -315,6 +670,15 @@ class CCDiscordBot(commands.Bot):
             f"🔄 If no response, will retry {max_attempts - attempt} more time(s)."
         )
 
+        discord_message_log.log(
+            message_id=str(message.id),
+            channel_id=str(self.channel.id),
+            thread_id=str(thread.id),
+            interaction_id=interaction_id,
+            message_type="question",
+            content=content,
+        )
+
         logger.info(f"Posted question for session {session_id} (attempt {attempt}/{max_attempts})")
 
         return str(thread.id), str(message.id)
@@ -324,21 +688,24 @@ class CCDiscordBot(commands.Bot):
         session_id: str,
         message: str,
         priority: str = "normal",
-        summary: Optional[str] = None
+        summary: Optional[str] = None,
+        wait: bool = True,
     ):
-        """Post a notification to Discord.
+        """Queue a notification for posting to Discord.
 
         Args:
             session_id: Session ID sending the notification
             message: Notification message
             priority: Priority level ('normal' or 'urgent')
             summary: Optional summary or additional details
+            wait: Wait until the message is sent and raise if sending fails;
+                pass False to return as soon as it is queued
         """
         if not self.channel:
             raise RuntimeError("Discord bot not ready - channel not available")
 
         # Choose emoji based on priority
-        emoji = "⚠️" if priority == "urgent" else "✅"
+        emoji = _NOTIFY_EMOJI.get(priority, _NOTIFY_EMOJI["normal"])
 
         # Format the message
         content = f"{emoji} **Session {session_id[:8]} Notification**\n\n{message}"
@@ -346,12 +713,37 @@ class CCDiscordBot(commands.Bot):
         if summary:
             content += f"\n\n**Summary:**\n{summary}"
 
-        content += f"\n\n_Session: {session_id} | Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC_"
+        content += f"\n\n_Session: {session_id} | Time: {datetime.now(timezone.utc).isoformat(sep=' ', timespec='seconds')}_"
 
-        # Post the message
-        await self.channel.send(content)
+        # Queue the message; bursts are smoothed out by the send worker
+        future = asyncio.get_running_loop().create_future() if wait else None
+        await self._outbound.put((session_id, priority, content, future))
+        if future is not None:
+            await future
 
-        logger.info(f"Posted notification for session {session_id} (priority: {priority})")
+    async def _drain_outbound(self):
+        """Send queued notifications one at a time."""
+        while True:
+            session_id, priority, content, future = await self._outbound.get()
+            try:
+                sent = await self.channel.send(content)
+
+                discord_message_log.log(
+                    message_id=str(sent.id),
+                    channel_id=str(self.channel.id),
+                    message_type="notification",
+                    content=content,
+                )
+
+                logger.info(f"Posted notification for session {session_id} (priority: {priority})")
+                if future is not None and not future.done():
+                    future.set_result(None)
+            except Exception as e:
+                logger.error(f"Failed to post notification for session {session_id}: {e}", exc_info=True)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            finally:
+                self._outbound.task_done()
 
     async def post_retry_message(
         self,
@@ -374,13 +766,10 @@ class CCDiscordBot(commands.Bot):
             raise RuntimeError("Discord bot not ready - channel not available")
 
         # Get the thread
-        thread = self.channel.get_thread(int(thread_id))
+        thread = await self._get_thread(thread_id)
         if not thread:
-            try:
-                thread = await self.channel.fetch_thread(int(thread_id))
-            except discord.NotFound:
-                logger.error(f"Thread {thread_id} not found for retry message")
-                return
+            logger.error(f"Thread {thread_id} not found for retry message")
+            return
 
         # Post retry message
         emoji = "⏰" if attempt < max_attempts else "🚨"
@@ -394,7 +783,15 @@ class CCDiscordBot(commands.Bot):
         if attempt == max_attempts:
             content += f"\n\n⚠️ **This is the final attempt - session will fail if no response.**"
 
-        await thread.send(content)
+        sent = await thread.send(content)
+
+        discord_message_log.log(
+            message_id=str(sent.id),
+            channel_id=str(self.channel.id),
+            thread_id=thread_id,
+            message_type="retry",
+            content=content,
+        )
 
         logger.info(f"Posted retry message in thread {thread_id} (attempt {attempt}/{max_attempts})")
 
@@ -422,34 +819,27 @@ class CCDiscordBot(commands.Bot):
         await interaction.response.defer()
 
         try:
-            from app.services.task import TaskService
-            from app.models.task import TaskCreate, TaskConfig
-
-            async for db in get_db_session():
-                try:
-                    task_service = TaskService(db)
-
-                    task_data = TaskCreate(
-                        task_name=name,
-                        task_type="manual",
-                        description=description,
-                        template_prompt=prompt,
-                        config=TaskConfig(),
-                        owner_user_id=str(interaction.user.id)
-                    )
+            async with get_db_context() as db:
+                task_service = TaskService(db)
+
+                task_data = TaskCreate(
+                    task_name=name,
+                    task_type="manual",
+                    description=description,
+                    template_prompt=prompt,
+                    config=TaskConfig(),
+                    owner_user_id=str(interaction.user.id)
+                )
 
-                    task = await task_service.create_task(task_data)
+                task = await task_service.create_task(task_data)
 
-                    await interaction.followup.send(
-                        f"✅ **Task Created**\n\n"
-                        f"Name: `{task.task_name}`\n"
-                        f"ID: `{task.id}`\n"
-                        f"Description: {task.description or 'None'}\n\n"
-                        f"Use `/task-start {task.task_name}` to run it manually."
-                    )
-
-                finally:
-                    await db.close()
+                await interaction.followup.send(
+                    f"✅ **Task Created**\n\n"
+                    f"Name: `{task.task_name}`\n"
+                    f"ID: `{task.id}`\n"
+                    f"Description: {task.description or 'None'}\n\n"
+                    f"Use `/task-start {task.task_name}` to run it manually."
+                )
 
         except Exception as e:
             logger.error(f"Error creating task: {e}", exc_info=True)
@@ -465,38 +855,32 @@ class CCDiscordBot(commands.Bot):
         await interaction.response.defer()
 
         try:
-            from app.services.task import TaskService
-
-            async for db in get_db_session():
-                try:
-                    task_service = TaskService(db)
-                    tasks, total = await task_service.list_tasks(
-                        owner_user_id=str(interaction.user.id),
-                        task_type=task_type,
-                        enabled=enabled,
-                        limit=20
-                    )
-
-                    if not tasks:
-                        await interaction.followup.send("📋 No tasks found.")
-                        return
+            async with get_db_context() as db:
+                task_service = TaskService(db)
+                tasks, total = await task_service.list_tasks_summary(
+                    owner_user_id=str(interaction.user.id),
+                    task_type=task_type,
+                    enabled=enabled,
+                    limit=20
+                )
 
-                    lines = ["📋 **Your Tasks**\n"]
-                    for task in tasks:
-                        status = "✅" if task.enabled else "⏸️"
-                        schedule = f" | `{task.schedule_cron}`" if task.schedule_cron else ""
-                        lines.append(
-                            f"{status} **{task.task_name}** ({task.task_type}){schedule}\n"
-                            f"   Runs: {task.run_count} | Success: {task.success_count} | "
-                            f"Failed: {task.failure_count}"
-                        )
+                if not tasks:
+                    await interaction.followup.send("📋 No tasks found.")
+                    return
 
-                    lines.append(f"\n_Total: {total} tasks_")
+                lines = ["📋 **Your Tasks**\n"]
+                for task in tasks:
+                    status = "✅" if task.enabled else "⏸️"
+                    schedule = f" | `{task.schedule_cron}`" if task.schedule_cron else ""
+                    lines.append(
+                        f"{status} **{task.task_name}** ({task.task_type}){schedule}\n"
+                        f"   Runs: {task.run_count} | Success: {task.success_count} | "
+                        f"Failed: {task.failure_count}"
+                    )
 
-                    await interaction.followup.send("\n".join(lines))
+                lines.append(f"\n_Total: {total} tasks_")
 
-                finally:
-                    await db.close()
+                await interaction.followup.send("\n".join(lines))
 
         except Exception as e:
             logger.error(f"Error listing tasks: {e}", exc_info=True)
@@ -507,35 +891,29 @@ class CCDiscordBot(commands.Bot):
         await interaction.response.defer()
 
         try:
-            from app.services.task import TaskService
+            async with get_db_context() as db:
+                task_service = TaskService(db)
+
+                # Start task with empty parameters (use defaults)
+                started = await task_service.start_task_by_name(
+                    task_name,
+                    trigger="manual",
+                    triggered_by_user_id=str(interaction.user.id)
+                )
 
-            async for db in get_db_session():
-                try:
-                    task_service = TaskService(db)
-                    task = await task_service.get_task(task_name=task_name)
-
-                    if not task:
-                        await interaction.followup.send(f"❌ Task `{task_name}` not found.")
-                        return
-
-                    # Start task with empty parameters (use defaults)
-                    task_run, filled_prompt = await task_service.start_task(
-                        task_id=task.id,
-                        parameters=task.optional_parameters or {},
-                        trigger="manual",
-                        triggered_by_user_id=str(interaction.user.id)
-                    )
+                if not started:
+                    await interaction.followup.send(f"❌ Task `{task_name}` not found.")
+                    return
 
-                    await interaction.followup.send(
-                        f"🚀 **Task Started**\n\n"
-                        f"Task: `{task.task_name}`\n"
-                        f"Run ID: `{task_run.id}`\n"
-                        f"Status: {task_run.status}\n\n"
-                        f"Monitor progress in this channel."
-                    )
+                task, task_run, filled_prompt = started
 
-                finally:
-                    await db.close()
+                await interaction.followup.send(
+                    f"🚀 **Task Started**\n\n"
+                    f"Task: `{task.task_name}`\n"
+                    f"Run ID: `{task_run.id}`\n"
+                    f"Status: {task_run.status}\n\n"
+                    f"Monitor progress in this channel."
+                )
 
         except Exception as e:
             logger.error(f"Error starting task: {e}", exc_info=True)
@@ -557,50 +935,46 @@ class CCDiscordBot(commands.Bot):
         """Handle /task-schedule command."""
         await interaction.response.defer()
 
-        try:
-            from app.services.task import TaskService
-            from app.services.scheduler import SchedulerService
-            from app.models.task import TaskUpdate
-
-            async for db in get_db_session():
-                try:
-                    task_service = TaskService(db)
-                    scheduler = SchedulerService()
+        scheduler = self._scheduler
+        if scheduler is None:
+            await interaction.followup.send("❌ Scheduler is not available.")
+            return
 
-                    task = await task_service.get_task(task_name=task_name)
+        try:
+            async with get_db_context() as db:
+                task_service = TaskService(db)
 
-                    if not task:
-                        await interaction.followup.send(f"❌ Task `{task_name}` not found.")
-                        return
+                task = await task_service.get_task(task_name=task_name)
 
-                    # Validate cron expression
-                    if not scheduler.validate_cron(cron):
-                        await interaction.followup.send(
-                            f"❌ Invalid cron expression: `{cron}`\n\n"
-                            f"Example: `0 9 * * *` = daily at 9:00 AM"
-                        )
-                        return
+                if not task:
+                    await interaction.followup.send(f"❌ Task `{task_name}` not found.")
+                    return
 
-                    # Update task schedule
-                    update_data = TaskUpdate(schedule_cron=cron)
-                    task = await task_service.update_task(task.id, update_data)
+                # Validate cron expression
+                if not scheduler.validate_cron(cron):
+                    await interaction.followup.send(
+                        f"❌ Invalid cron expression: `{cron}`\n\n"
+                        f"Example: `0 9 * * *` = daily at 9:00 AM"
+                    )
+                    return
 
-                    # Add to scheduler
-                    await scheduler.add_task_schedule(task, db)
+                # Update task schedule
+                update_data = TaskUpdate(schedule_cron=cron)
+                task = await task_service.update_task(task.id, update_data)
 
-                    # Get next run times
-                    next_runs = await scheduler.get_next_run_times(cron, count=3)
-                    next_times = "\n".join([f"  • {t.strftime('%Y-%m-%d %H:%M:%S')}" for t in next_runs])
+                # Add to scheduler
+                await scheduler.add_task_schedule(task, db)
 
-                    await interaction.followup.send(
-                        f"⏰ **Task Scheduled**\n\n"
-                        f"Task: `{task.task_name}`\n"
-                        f"Schedule: `{cron}`\n\n"
-                        f"**Next 3 runs:**\n{next_times}"
-                    )
+                # Get next run times
+                next_runs = await scheduler.get_next_run_times(cron, count=3)
+                next_times = "\n".join([f"  • {t.strftime('%Y-%m-%d %H:%M:%S')}" for t in next_runs])
 
-                finally:
-                    await db.close()
+                await interaction.followup.send(
+                    f"⏰ **Task Scheduled**\n\n"
+                    f"Task: `{task.task_name}`\n"
+                    f"Schedule: `{cron}`\n\n"
+                    f"**Next 3 runs:**\n{next_times}"
+                )
 
         except Exception as e:
             logger.error(f"Error scheduling task: {e}", exc_info=True)
@@ -626,27 +1000,30 @@ class CCDiscordBot(commands.Bot):
             logger.error(f"Error getting VNC link: {e}", exc_info=True)
             await interaction.followup.send(f"❌ Failed to get VNC link: {str(e)}", ephemeral=True)
 
-    def _format_question_message(
+    def _question_template(
         self,
         session_id: str,
         question: str,
-        minutes_remaining: int,
         attempt: int,
         max_attempts: int,
-        priority: str
-    ) -> str:
-        """Format a question message."""
-        emoji = "🚨" if priority == "urgent" else "🤔"
+        priority: str,
+        created: datetime,
+    ) -> tuple[str, str]:
+        """Format a question message, split where the minutes remaining go."""
+        emoji = _QUESTION_EMOJI.get(priority, _QUESTION_EMOJI["normal"])
 
-        content = (
+        head = (
             f"{emoji} **Question from Session {session_id[:8]}**\n\n"
             f"{question}\n\n"
-            f"⏱️ Timeout: {minutes_remaining} minutes remaining (Attempt {attempt}/{max_attempts})\n"
+            f"⏱️ Timeout: "
+        )
+        tail = (
+            f" minutes remaining (Attempt {attempt}/{max_attempts})\n"
             f"📝 Reply in the thread to answer\n\n"
-            f"_Session: {session_id} | Created: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC_"
+            f"_Session: {session_id} | Created: {created.isoformat(sep=' ', timespec='seconds')}_"
         )
 
-        return content
+        return head, tail
 
 
 # Global bot instance
@@ -654,11 +1031,12 @@ _bot_instance: Optional[CCDiscordBot] = None
 _bot_task: Optional[asyncio.Task] = None
 
 
-async def start_discord_bot(redis_client):
+async def start_discord_bot(redis_client, scheduler=None):
     """Start the Discord bot.
 
     Args:
         redis_client: Redis client for pub/sub communication
+        scheduler: Running SchedulerService for /task-schedule
     """
     global _bot_instance, _bot_task
 
@@ -673,7 +1051,8 @@ async def start_discord_bot(redis_client):
     try:
         _bot_instance = CCDiscordBot(
             channel_id=int(settings.discord_channel_id),
-            redis_client=redis_client
+            redis_client=redis_client,
+            scheduler=scheduler,
         )
 
         # Start the bot in the background
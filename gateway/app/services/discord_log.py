@@ -0,0 +1,54 @@
+"""Write-behind audit log for outbound Discord messages."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import uuid4
+
+from prometheus_client import Gauge
+
+from app.db.models import DiscordMessage
+from app.services.write_behind import WriteBehindLog
+
+queue_depth = Gauge(
+    "discord_message_log_queue_depth",
+    "DiscordMessage rows waiting to be written",
+)
+
+
+class DiscordMessageLog(WriteBehindLog):
+    """Buffers DiscordMessage rows and inserts them in batches."""
+
+    def __init__(self):
+        super().__init__(DiscordMessage, "Discord message log")
+        queue_depth.set_function(self.qsize)
+
+    def log(
+        self,
+        message_id: str,
+        channel_id: str,
+        message_type: str,
+        content: Optional[str] = None,
+        thread_id: Optional[str] = None,
+        task_run_id: Optional[str] = None,
+        interaction_id: Optional[str] = None,
+        **extra: Any,
+    ) -> None:
+        """Queue a message row without waiting for the database."""
+        self.add(
+            {
+                "id": str(uuid4()),
+                "message_id": message_id,
+                "channel_id": channel_id,
+                "thread_id": thread_id,
+                "task_run_id": task_run_id,
+                "interaction_id": interaction_id,
+                "message_type": message_type,
+                "content": content,
+                "sent_at": datetime.now(timezone.utc),
+                **extra,
+            }
+        )
+
+
+# Global message log instance
+discord_message_log = DiscordMessageLog()
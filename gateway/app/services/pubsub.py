@@ -1,12 +1,14 @@
 """Redis pub/sub service for real-time communication."""
 
 import asyncio
-import json
 import logging
-from datetime import datetime
-from typing import Any, AsyncIterator, Callable, Dict, Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+import orjson
 import redis.asyncio as redis
+from redis.asyncio.client import PubSub
 
 from app.core.config import get_settings
 
@@ -14,22 +16,81 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload; non-string keys are stringified as json.dumps would."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+# (epoch milliseconds, formatted timestamp) most recently handed out
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Naive UTC ISO timestamp, formatted at most once per millisecond."""
+    global _ts_cache
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _ts_cache[0]:
+        now = datetime.fromtimestamp(now_ms / 1000, timezone.utc).replace(tzinfo=None)
+        _ts_cache = (now_ms, now.isoformat(timespec="milliseconds"))
+    return _ts_cache[1]
+
+
 class PubSubService:
     """Service for Redis pub/sub operations."""
 
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
         self._subscriptions: Dict[str, asyncio.Task] = {}
+        # Publishes queued this loop iteration, sent together in one pipeline
+        self._pending: List[Tuple[str, bytes, asyncio.Future]] = []
+        self._flush_tasks: set[asyncio.Task] = set()
+        # One pub/sub connection for every channel, fanned out to local queues
+        self._shared_pubsub: Optional[PubSub] = None
+        self._listeners: Dict[str, List[asyncio.Queue]] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        # Channels emptied this loop iteration, unsubscribed in one command
+        self._unsubscribe_batch: Optional[Tuple[List[str], asyncio.Future]] = None
 
     async def publish(
         self, channel: str, message: Dict[str, Any]
     ) -> int:
-        """Publish a message to a channel."""
+        """Publish a message to a channel; returns the number of receivers."""
         payload = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _timestamp(),
             **message,
         }
-        return await self.redis.publish(channel, json.dumps(payload))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((channel, _dumps(payload), future))
+        if len(self._pending) == 1:
+            # Deferred with call_soon (not a task, which may run eagerly) so
+            # everything published this iteration joins the batch
+            loop.call_soon(self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        """Send the queued publishes in the background."""
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[str, bytes, asyncio.Future]]) -> None:
+        """Publish a batch in one round trip and resolve each caller."""
+        pipe = self.redis.pipeline(transaction=False)
+        for channel, data, _ in batch:
+            pipe.publish(channel, data)
+        try:
+            results = await pipe.execute()
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), receivers in zip(batch, results):
+            if not future.done():
+                future.set_result(receivers)
 
     async def publish_session_output(
         self, session_id: str, message: Dict[str, Any]
@@ -66,20 +127,124 @@ class PubSubService:
         self, channel: str
     ) -> AsyncIterator[Dict[str, Any]]:
         """Subscribe to a channel and yield messages."""
-        pubsub = self.redis.pubsub()
-        await pubsub.subscribe(channel)
+        queue: asyncio.Queue = asyncio.Queue()
+        await self._add_listener(channel, queue)
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await self._remove_listener(channel, queue)
+
+    async def _add_listener(self, channel: str, queue: asyncio.Queue) -> None:
+        """Register a queue, subscribing the shared connection on first use."""
+        if self._shared_pubsub is None:
+            self._shared_pubsub = self.redis.pubsub()
+        pubsub = self._shared_pubsub
+
+        listeners = self._listeners.setdefault(channel, [])
+        listeners.append(queue)
+        if len(listeners) == 1:
+            await pubsub.subscribe(channel)
+
+        # listen() returns immediately until something is subscribed
+        if self._reader_task is None and pubsub is self._shared_pubsub:
+            self._reader_task = asyncio.create_task(self._read(pubsub))
 
+    async def _remove_listener(self, channel: str, queue: asyncio.Queue) -> None:
+        """Drop a queue; unsubscribe once the channel has no listeners left."""
+        listeners = self._listeners.get(channel)
+        if listeners is None or queue not in listeners:
+            return
+        listeners.remove(queue)
+        if listeners:
+            return
+
+        del self._listeners[channel]
+        pubsub = self._shared_pubsub
+        if pubsub is None:
+            return
+        if self._listeners:
+            await self._unsubscribe(pubsub, channel)
+            return
+
+        # Last channel gone: give the connection back to the pool
+        reader, self._reader_task = self._reader_task, None
+        self._shared_pubsub = None
+        if reader is not None:
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        await pubsub.aclose()
+
+    async def _unsubscribe(self, pubsub: PubSub, channel: str) -> None:
+        """Queue an UNSUBSCRIBE to share with other channels emptied this iteration."""
+        if self._unsubscribe_batch is None:
+            loop = asyncio.get_running_loop()
+            self._unsubscribe_batch = ([], loop.create_future())
+            loop.call_soon(self._start_unsubscribe, pubsub)
+        channels, future = self._unsubscribe_batch
+        channels.append(channel)
+        # Shielded so one cancelled caller doesn't cancel the whole batch
+        await asyncio.shield(future)
+
+    def _start_unsubscribe(self, pubsub: PubSub) -> None:
+        """Send the queued unsubscribes in the background."""
+        channels, future = self._unsubscribe_batch
+        self._unsubscribe_batch = None
+        task = asyncio.create_task(self._send_unsubscribe(pubsub, channels, future))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_unsubscribe(
+        self, pubsub: PubSub, channels: List[str], future: asyncio.Future
+    ) -> None:
+        """Unsubscribe a batch of channels in one round trip."""
+        # Channels that picked up a new listener meanwhile stay subscribed, and
+        # a connection closed meanwhile has already dropped everything
+        channels = [channel for channel in channels if channel not in self._listeners]
+        try:
+            if channels and pubsub is self._shared_pubsub:
+                await pubsub.unsubscribe(*channels)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    async def _read(self, pubsub: PubSub) -> None:
+        """Dispatch messages from the shared connection to channel listeners."""
         try:
             async for message in pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        data = json.loads(message["data"])
-                        yield data
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON in message: {message['data']}")
-        finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.close()
+                if message["type"] != "message":
+                    continue
+                listeners = self._listeners.get(message["channel"])
+                if not listeners:
+                    continue
+                try:
+                    # Decoded once for every listener on the channel
+                    data = orjson.loads(message["data"])
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Invalid JSON in message: {message['data']}")
+                    continue
+                for queue in listeners:
+                    queue.put_nowait(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Shared pub/sub reader failed: {e}")
+            # Hand the error to every subscriber, as a dedicated connection would
+            if self._shared_pubsub is pubsub:
+                self._shared_pubsub = None
+                self._reader_task = None
+            for listeners in self._listeners.values():
+                for queue in listeners:
+                    queue.put_nowait(e)
+            self._listeners.clear()
+            await pubsub.aclose()
 
     async def subscribe_session_output(
         self, session_id: str
@@ -117,11 +282,36 @@ class PubSubService:
             except asyncio.CancelledError:
                 pass
 
+    async def unsubscribe_all(self) -> None:
+        """Cancel every callback subscription at once."""
+        tasks = list(self._subscriptions.values())
+        self._subscriptions.clear()
+        for task in tasks:
+            task.cancel()
+        # The listeners unwind together, so their channels share one UNSUBSCRIBE
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stop every subscriber and release the shared connection."""
+        await self.unsubscribe_all()
+        reader, self._reader_task = self._reader_task, None
+        pubsub, self._shared_pubsub = self._shared_pubsub, None
+        # Wake any remaining subscribers so their generators unwind
+        for listeners in self._listeners.values():
+            for queue in listeners:
+                queue.put_nowait(ConnectionError("Pub/sub service closed"))
+        self._listeners.clear()
+        if reader is not None:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+        if pubsub is not None:
+            await pubsub.aclose()
+
     async def push_input(self, session_id: str, prompt: str) -> None:
         """Push input to session's input queue."""
         await self.redis.rpush(
             f"session:{session_id}:input",
-            json.dumps({"prompt": prompt, "timestamp": datetime.utcnow().isoformat()}),
+            _dumps({"prompt": prompt, "timestamp": _timestamp()}),
         )
 
     async def pop_input(
@@ -132,7 +322,7 @@ class PubSubService:
             f"session:{session_id}:input", timeout=timeout
         )
         if result:
-            return json.loads(result[1])
+            return orjson.loads(result[1])
         return None
 
     async def send_control(
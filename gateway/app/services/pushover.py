@@ -1,11 +1,10 @@
 """Pushover notification service."""
 
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
-import requests
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import PushoverNotification, TaskRun
@@ -13,17 +12,35 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# One client for every PushoverService so notifications reuse the keep-alive connection
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Pushover HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=PushoverService.PUSHOVER_API_BASE,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _client
+
 
 class PushoverService:
     """Service for sending Pushover notifications."""
 
-    PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+    PUSHOVER_API_BASE = "https://api.pushover.net"
+    PUSHOVER_MESSAGES_PATH = "/1/messages.json"
 
     def __init__(self, db: AsyncSession):
         """Initialize Pushover service."""
         self.db = db
         self.settings = get_settings()
-        self.api_token = getattr(self.settings, "PUSHOVER_API_TOKEN", None)
+        self.api_token = self.settings.pushover_api_token
+        # Fields shared by every request from this service
+        self._base_data = {"token": self.api_token}
 
     async def send_notification(
         self,
@@ -56,7 +73,7 @@ class PushoverService:
 
         # Build request data
         data = {
-            "token": self.api_token,
+            **self._base_data,
             "user": user_key,
             "message": message,
             "priority": priority,
@@ -71,7 +88,7 @@ class PushoverService:
 
         # Send to Pushover
         try:
-            response = requests.post(self.PUSHOVER_API_URL, data=data, timeout=10)
+            response = await _get_client().post(self.PUSHOVER_MESSAGES_PATH, data=data)
             response_json = response.json()
 
             # Log notification
@@ -91,7 +108,7 @@ class PushoverService:
 
             return response_json
 
-        except requests.RequestException as e:
+        except (httpx.RequestError, ValueError) as e:
             logger.error(f"Failed to send Pushover notification: {e}")
             await self._log_notification(
                 task_run_id=task_run_id,
@@ -198,7 +215,6 @@ class PushoverService:
             user_key=user_key,
             message=message,
             priority=priority,
-            sent_at=datetime.now(timezone.utc),
             pushover_response=pushover_response,
             success=success,
         )
@@ -1,8 +1,11 @@
 """Scheduler service for managing scheduled tasks."""
 
+import copy
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Optional
+from uuid import uuid4
 from croniter import croniter
 import pytz
 
@@ -13,9 +16,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Task, ScheduleHistory
 from app.services.task import TaskService
+from app.services.write_behind import WriteBehindLog
 
 logger = logging.getLogger(__name__)
 
+# Distinct cron expressions/timezones kept parsed
+_CRON_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_CRON_CACHE_SIZE)
+def _croniter_template(cron_expression: str) -> croniter:
+    """Parse a cron expression once; copy the result before iterating it."""
+    return croniter(cron_expression)
+
+
+@lru_cache(maxsize=_CRON_CACHE_SIZE)
+def _cron_trigger(cron_expression: str, timezone_str: str) -> CronTrigger:
+    """Build a CronTrigger once per expression and timezone; triggers are stateless."""
+    return CronTrigger.from_crontab(cron_expression, timezone=pytz.timezone(timezone_str))
+
 
 class SchedulerService:
     """Service for managing task schedules with APScheduler."""
@@ -31,10 +50,13 @@ class SchedulerService:
             }
         )
         self._initialized = False
+        # Schedule changes are audit rows, written in batches off the request path
+        self._history = WriteBehindLog(ScheduleHistory, "Schedule history log")
 
     async def start(self):
         """Start the scheduler."""
         if not self._initialized:
+            await self._history.start()
             self.scheduler.start()
             self._initialized = True
             logger.info("APScheduler started")
@@ -42,6 +64,7 @@ class SchedulerService:
     async def shutdown(self):
         """Shutdown the scheduler."""
         if self._initialized:
+            await self._history.stop()
             self.scheduler.shutdown(wait=True)
             self._initialized = False
             logger.info("APScheduler shutdown")
@@ -56,24 +79,23 @@ class SchedulerService:
             logger.warning(f"Task {task.task_name} has no cron schedule")
             return None
 
-        # Validate cron expression
+        trigger = self._build_trigger(task)
+        return self._register_job(task, trigger)
+
+    def _build_trigger(self, task: Task) -> CronTrigger:
+        """Validate a task's cron schedule and return its (cached) trigger."""
         if not self.validate_cron(task.schedule_cron):
             raise ValueError(f"Invalid cron expression: {task.schedule_cron}")
 
-        # Remove existing job if any
-        job_id = f"task_{task.id}"
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
-
-        # Create cron trigger
         try:
-            tz = pytz.timezone(task.schedule_timezone)
-            trigger = CronTrigger.from_crontab(task.schedule_cron, timezone=tz)
+            return _cron_trigger(task.schedule_cron, task.schedule_timezone)
         except Exception as e:
             logger.error(f"Failed to create cron trigger: {e}")
             raise ValueError(f"Invalid cron or timezone: {e}")
 
-        # Add job
+    def _register_job(self, task: Task, trigger: CronTrigger) -> str:
+        """Add or replace a task's APScheduler job and record the change."""
+        job_id = f"task_{task.id}"
         job = self.scheduler.add_job(
             self._execute_scheduled_task,
             trigger=trigger,
@@ -89,8 +111,7 @@ class SchedulerService:
             task.next_run_at = next_run
 
         # Log schedule history
-        await self._log_schedule_change(
-            db,
+        self._log_schedule_change(
             task.id,
             "schedule_created",
             None,
@@ -120,8 +141,7 @@ class SchedulerService:
             self.scheduler.remove_job(job_id)
 
             # Log schedule history
-            await self._log_schedule_change(
-                db,
+            self._log_schedule_change(
                 task.id,
                 "schedule_removed",
                 task.schedule_cron,
@@ -160,7 +180,9 @@ class SchedulerService:
         try:
             tz = pytz.timezone(timezone_str)
             base_time = datetime.now(tz)
-            cron = croniter(cron_expression, base_time)
+            # Reuse the parsed fields; get_next copies them before changing anything
+            cron = copy.copy(_croniter_template(cron_expression))
+            cron.set_current(base_time, force=True)
 
             run_times = []
             for _ in range(count):
@@ -175,7 +197,7 @@ class SchedulerService:
     def validate_cron(self, cron_expression: str) -> bool:
         """Validate a cron expression."""
         try:
-            croniter(cron_expression)
+            _croniter_template(cron_expression)
             return True
         except Exception:
             return False
@@ -226,9 +248,8 @@ class SchedulerService:
             finally:
                 break  # Only use first db session
 
-    async def _log_schedule_change(
+    def _log_schedule_change(
         self,
-        db: AsyncSession,
         task_id: str,
         action: str,
         schedule_before: Optional[str],
@@ -236,23 +257,20 @@ class SchedulerService:
         triggered_by: str,
         user_id: Optional[str]
     ):
-        """Log a schedule change to history."""
-        from uuid import uuid4
-
-        history = ScheduleHistory(
-            id=str(uuid4()),
-            task_id=task_id,
-            action=action,
-            schedule_before=schedule_before,
-            schedule_after=schedule_after,
-            triggered_by=triggered_by,
-            user_id=user_id,
-            timestamp=datetime.now(timezone.utc),
+        """Queue a schedule change for the history table."""
+        self._history.add(
+            {
+                "id": str(uuid4()),
+                "task_id": task_id,
+                "action": action,
+                "schedule_before": schedule_before,
+                "schedule_after": schedule_after,
+                "triggered_by": triggered_by,
+                "user_id": user_id,
+                "timestamp": datetime.now(timezone.utc),
+            }
         )
 
-        db.add(history)
-        await db.commit()
-
     async def reload_all_schedules(self, db: AsyncSession):
         """Reload all task schedules from database."""
         from sqlalchemy import select
@@ -270,10 +288,20 @@ class SchedulerService:
         )
         tasks = result.scalars().all()
 
-        count = 0
+        # Triggers are built up front (CPU only, cached per expression) so one
+        # bad schedule is skipped without holding up the rest
+        triggers = []
         for task in tasks:
             try:
-                await self.add_task_schedule(task, db)
+                triggers.append((task, self._build_trigger(task)))
+            except ValueError as e:
+                logger.error(f"Failed to reload schedule for {task.task_name}: {e}")
+
+        # Registering is synchronous; history rows go out in one write-behind batch
+        count = 0
+        for task, trigger in triggers:
+            try:
+                self._register_job(task, trigger)
                 count += 1
             except Exception as e:
                 logger.error(f"Failed to reload schedule for {task.task_name}: {e}")
@@ -5,15 +5,16 @@ import logging
 import os
 import tempfile
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
 import redis.asyncio as redis
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.db.models import Message, Session
+from app.models.container import ContainerInfo, ContainerStatus
 from app.models.session import (
     SessionConfig,
     SessionCreate,
@@ -81,78 +82,83 @@ class SessionService:
                 request.config.claude_config.model_dump()
             )
 
-        # Create container with parent workspace for mounting children directory
-        container_info = await self.container_manager.create_container(
+        db_session: Optional[Session] = None
+
+        async def record_container(container_info: ContainerInfo) -> None:
+            """Persist the session before its container is started."""
+            nonlocal db_session
+            # Create database record
+            db_session = Session(
+                id=session_id,
+                status=SessionStatus.STARTING,
+                container_id=container_info.container_id,
+                parent_session_id=request.parent_session_id,
+                workspace_type=request.workspace.type.value,
+                workspace_id=request.workspace.id,
+                config=request.config.model_dump(),
+            )
+            self.db.add(db_session)
+            await self.db.commit()
+
+            # Store session state in Redis (including workspace path for child access)
+            # and add it to the active set, together in one round trip
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    f"session:{session_id}:state",
+                    mapping={
+                        "status": SessionStatus.STARTING,
+                        "container_id": container_info.container_id,
+                        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
+                        "workspace_path": workspace_path,
+                    },
+                )
+                pipe.sadd("active_sessions", session_id)
+                await pipe.execute()
+
+        # Create (with parent workspace for mounting children directory), record,
+        # start and wait for the container, reusing one handle throughout
+        container_info = await self.container_manager.launch(
             session_id=session_id,
             workspace_path=workspace_path,
             environment=environment,
+            on_created=record_container,
             claude_config_path=settings.claude_config_path,
             claude_credentials_path=settings.claude_credentials_path,
             parent_workspace_path=parent_workspace_path,
         )
 
-        # Create database record
-        db_session = Session(
-            id=session_id,
-            status=SessionStatus.STARTING,
-            container_id=container_info.container_id,
-            parent_session_id=request.parent_session_id,
-            workspace_type=request.workspace.type.value,
-            workspace_id=request.workspace.id,
-            config=request.config.model_dump(),
-        )
-        self.db.add(db_session)
-        await self.db.commit()
-
-        # Store session state in Redis (including workspace path for child access)
-        await self.redis.hset(
-            f"session:{session_id}:state",
-            mapping={
-                "status": SessionStatus.STARTING,
-                "container_id": container_info.container_id,
-                "last_heartbeat": datetime.utcnow().isoformat(),
-                "workspace_path": workspace_path,
-            },
-        )
-
-        # Add to active sessions set
-        await self.redis.sadd("active_sessions", session_id)
-
-        # Start container
-        await self.container_manager.start_container(container_info.container_id)
-
-        # Wait for startup
-        started = await self.container_manager.wait_for_startup(
-            container_info.container_id
-        )
-
-        if started:
-            await self._update_status(session_id, SessionStatus.IDLE)
+        if container_info.status == ContainerStatus.RUNNING:
+            await self._update_status(session_id, SessionStatus.IDLE, db_session)
         else:
-            await self._update_status(session_id, SessionStatus.FAILED)
+            await self._update_status(session_id, SessionStatus.FAILED, db_session)
             raise RuntimeError(f"Container failed to start for session {session_id}")
 
         return SessionResponse(
             session_id=session_id,
             status=SessionStatus.IDLE,
             container_id=container_info.container_id,
-            created_at=datetime.utcnow(),
-            websocket_url=f"ws://localhost:8000/api/v1/sessions/{session_id}/stream",
+            created_at=datetime.now(timezone.utc),
+            websocket_url=f"ws://localhost:8000/ws/v1/sessions/{session_id}/stream",
         )
 
     async def get_session(self, session_id: str) -> Optional[SessionDetail]:
         """Get session details."""
+        session = await self._load_db_session(session_id)
+        if not session:
+            return None
+        return await self._to_detail(session)
+
+    async def _load_db_session(self, session_id: str) -> Optional[Session]:
+        """Load the Session row."""
         result = await self.db.execute(
             select(Session).where(Session.id == session_id)
         )
-        session = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-        if not session:
-            return None
-
-        # Get child session IDs
+    async def _to_detail(self, session: Session) -> SessionDetail:
+        """Build SessionDetail from a loaded row, fetching its child ids."""
         child_result = await self.db.execute(
-            select(Session.id).where(Session.parent_session_id == session_id)
+            select(Session.id).where(Session.parent_session_id == session.id)
         )
         child_ids = [row[0] for row in child_result.fetchall()]
 
@@ -175,49 +181,79 @@ class SessionService:
         offset: int = 0,
     ) -> tuple[List[SessionDetail], int]:
         """List sessions with optional filtering."""
-        query = select(Session)
-
+        filters = []
         if status:
-            query = query.where(Session.status == status.value)
+            filters.append(Session.status == status.value)
 
-        # Get total count
-        count_result = await self.db.execute(
-            select(Session.id).where(Session.status == status.value if status else True)
-        )
-        total = len(count_result.fetchall())
-
-        # Get paginated results
-        query = query.order_by(Session.created_at.desc()).offset(offset).limit(limit)
-        result = await self.db.execute(query)
-        sessions = result.scalars().all()
+        # Count in the database instead of fetching every id
+        total = (
+            await self.db.execute(select(func.count()).select_from(Session).where(*filters))
+        ).scalar_one()
 
-        details = []
-        for session in sessions:
-            detail = await self.get_session(session.id)
-            if detail:
-                details.append(detail)
+        # Only the columns SessionDetail needs
+        result = await self.db.execute(
+            select(
+                Session.id,
+                Session.status,
+                Session.container_id,
+                Session.created_at,
+                Session.updated_at,
+                Session.parent_session_id,
+                Session.total_turns,
+            )
+            .where(*filters)
+            .order_by(Session.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = result.all()
+
+        # Children of the whole page in one query rather than one per session
+        child_ids: dict[str, List[str]] = {row.id: [] for row in rows}
+        if child_ids:
+            child_result = await self.db.execute(
+                select(Session.parent_session_id, Session.id).where(
+                    Session.parent_session_id.in_(child_ids)
+                )
+            )
+            for parent_id, child_id in child_result:
+                child_ids[parent_id].append(child_id)
+
+        details = [
+            SessionDetail(
+                session_id=row.id,
+                status=SessionStatus(row.status),
+                container_id=row.container_id,
+                created_at=row.created_at,
+                last_activity=row.updated_at,
+                parent_session_id=row.parent_session_id,
+                child_session_ids=child_ids[row.id],
+                total_turns=row.total_turns,
+            )
+            for row in rows
+        ]
 
         return details, total
 
     async def stop_session(self, session_id: str) -> SessionDetail:
         """Stop a session and its container."""
-        session = await self.get_session(session_id)
+        session = await self._load_db_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
         if session.container_id:
             await self.container_manager.stop_container(session.container_id)
 
-        await self._update_status(session_id, SessionStatus.STOPPED)
+        await self._update_status(session_id, SessionStatus.STOPPED, session)
 
         # Remove from active sessions
         await self.redis.srem("active_sessions", session_id)
 
-        return await self.get_session(session_id)
+        return await self._to_detail(session)
 
     async def delete_session(self, session_id: str) -> None:
         """Delete a session and cleanup resources."""
-        session = await self.get_session(session_id)
+        session = await self._load_db_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
@@ -228,34 +264,37 @@ class SessionService:
                 session.container_id, force=True
             )
 
-        # Remove from Redis
-        await self.redis.delete(f"session:{session_id}:state")
-        await self.redis.delete(f"session:{session_id}:input")
-        await self.redis.srem("active_sessions", session_id)
+        # Remove from Redis in one round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(f"session:{session_id}:state", f"session:{session_id}:input")
+            pipe.srem("active_sessions", session_id)
+            await pipe.execute()
 
         # Delete from database
-        result = await self.db.execute(
-            select(Session).where(Session.id == session_id)
-        )
-        db_session = result.scalar_one_or_none()
-        if db_session:
-            await self.db.delete(db_session)
-            await self.db.commit()
+        await self.db.delete(session)
+        await self.db.commit()
 
     async def _update_status(
-        self, session_id: str, status: SessionStatus
+        self,
+        session_id: str,
+        status: SessionStatus,
+        session: Optional[Session] = None,
     ) -> None:
-        """Update session status in both database and Redis."""
+        """Update session status in both database and Redis.
+
+        Pass the already-loaded row as ``session`` to skip the lookup.
+        """
         # Update database
-        result = await self.db.execute(
-            select(Session).where(Session.id == session_id)
-        )
-        session = result.scalar_one_or_none()
+        if session is None:
+            session = await self._load_db_session(session_id)
         if session:
+            now = datetime.now(timezone.utc)
             session.status = status.value
-            session.updated_at = datetime.utcnow()
+            # Set explicitly so the row stays readable after commit instead of
+            # being expired for the server-side onupdate
+            session.updated_at = now
             if status == SessionStatus.STOPPED:
-                session.stopped_at = datetime.utcnow()
+                session.stopped_at = now
             await self.db.commit()
 
         # Update Redis
@@ -1,12 +1,14 @@
 """MinIO storage service for workspaces and artifacts."""
 
-import io
+import asyncio
+import concurrent.futures
 import json
 import logging
 import tarfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from aiobotocore.session import AioSession
 
@@ -15,6 +17,48 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Snapshot parts are buffered one at a time (S3 requires >= 5 MiB for all but the last)
+_SNAPSHOT_PART_SIZE = 8 * 1024 * 1024
+# Parts uploaded concurrently; memory use is bounded by (this + 1) parts
+_SNAPSHOT_UPLOAD_CONCURRENCY = 4
+# Read size when streaming a snapshot back for extraction
+_SNAPSHOT_READ_SIZE = 1024 * 1024
+
+
+class _PartWriter:
+    """Write-only file object that cuts a byte stream into fixed-size parts."""
+
+    def __init__(self, submit: Callable[[bytes], None], part_size: int = _SNAPSHOT_PART_SIZE):
+        self._submit = submit
+        self._part_size = part_size
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._part_size:
+            self._submit(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(data)
+
+    def close(self) -> None:
+        """Submit whatever is left as the final (possibly short) part."""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class _StreamReader:
+    """Blocking read() over an async body, for use from a worker thread."""
+
+    def __init__(self, body: Any, loop: asyncio.AbstractEventLoop):
+        self._body = body
+        self._loop = loop
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = _SNAPSHOT_READ_SIZE
+        return asyncio.run_coroutine_threadsafe(self._body.read(size), self._loop).result()
+
 
 class StorageService:
     """Service for MinIO/S3 storage operations."""
@@ -115,32 +159,101 @@ class StorageService:
     async def create_workspace_snapshot(
         self, workspace_id: str, source_path: str
     ) -> str:
-        """Create a snapshot of a workspace."""
+        """Create a snapshot of a workspace, streamed to storage as a multipart upload."""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         key = f"workspaces/{workspace_id}/snapshot-{timestamp}.tar.gz"
+        bucket = settings.minio_bucket
+        client = await self._get_client()
 
-        # Create tarball in memory
-        buffer = io.BytesIO()
-        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
-            for path in Path(source_path).rglob("*"):
-                if path.is_file():
-                    arcname = str(path.relative_to(source_path))
-                    tar.add(str(path), arcname=arcname)
+        upload = await client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType="application/gzip"
+        )
+        upload_id = upload["UploadId"]
+
+        async def upload_part(part_number: int, data: bytes) -> str:
+            response = await client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            return response["ETag"]
 
-        buffer.seek(0)
-        await self.upload_file(key, buffer.read(), "application/gzip")
+        try:
+            # Walking, reading and compressing the tree is blocking work; parts
+            # are handed back to this loop for upload as they fill
+            parts = await asyncio.to_thread(
+                self._write_snapshot, source_path, upload_part, asyncio.get_running_loop()
+            )
+            await client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
 
+        logger.info(f"Uploaded workspace snapshot: {bucket}/{key} ({len(parts)} parts)")
         return key
 
+    @staticmethod
+    def _write_snapshot(
+        source_path: str,
+        upload_part: Callable[[int, bytes], Any],
+        loop: asyncio.AbstractEventLoop,
+    ) -> List[Dict[str, Any]]:
+        """Tar and gzip a tree into multipart upload parts (runs in a worker thread)."""
+        futures: List[concurrent.futures.Future] = []
+        slots = threading.Semaphore(_SNAPSHOT_UPLOAD_CONCURRENCY)
+
+        def submit(data: bytes) -> None:
+            # Block the tar writer while the maximum number of parts is in flight
+            slots.acquire()
+            for future in futures:
+                if future.done() and (exc := future.exception()):
+                    slots.release()
+                    raise exc
+            future = asyncio.run_coroutine_threadsafe(
+                upload_part(len(futures) + 1, data), loop
+            )
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+        writer = _PartWriter(submit)
+        try:
+            # "w|gz" streams forward only, so the archive never has to be seekable
+            with tarfile.open(fileobj=writer, mode="w|gz") as tar:
+                for path in Path(source_path).rglob("*"):
+                    if path.is_file():
+                        arcname = str(path.relative_to(source_path))
+                        tar.add(str(path), arcname=arcname)
+            writer.close()
+            return [
+                {"PartNumber": number, "ETag": future.result()}
+                for number, future in enumerate(futures, start=1)
+            ]
+        finally:
+            # Let in-flight parts settle before the caller completes or aborts
+            concurrent.futures.wait(futures)
+
     async def restore_workspace_snapshot(
         self, snapshot_key: str, target_path: str
     ) -> None:
-        """Restore a workspace from a snapshot."""
-        data = await self.download_file(snapshot_key)
+        """Restore a workspace from a snapshot, extracting it as it downloads."""
+        client = await self._get_client()
+        response = await client.get_object(Bucket=settings.minio_bucket, Key=snapshot_key)
+        loop = asyncio.get_running_loop()
+
+        def extract(body: Any) -> None:
+            reader = _StreamReader(body, loop)
+            with tarfile.open(fileobj=reader, mode="r|gz", bufsize=_SNAPSHOT_READ_SIZE) as tar:
+                tar.extractall(target_path)
 
-        buffer = io.BytesIO(data)
-        with tarfile.open(fileobj=buffer, mode="r:gz") as tar:
-            tar.extractall(target_path)
+        async with response["Body"] as body:
+            await asyncio.to_thread(extract, body)
 
         logger.info(f"Restored workspace to {target_path}")
 
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Task, TaskRun, DiscordChannel, ScheduleHistory
@@ -85,26 +85,68 @@ class TaskService:
         offset: int = 0
     ) -> tuple[List[Task], int]:
         """List tasks with filters."""
-        query = select(Task).where(Task.deleted_at.is_(None))
-
+        conditions = [Task.deleted_at.is_(None)]
         if owner_user_id:
-            query = query.where(Task.owner_user_id == owner_user_id)
+            conditions.append(Task.owner_user_id == owner_user_id)
         if task_type:
-            query = query.where(Task.task_type == task_type)
+            conditions.append(Task.task_type == task_type)
         if enabled is not None:
-            query = query.where(Task.enabled == enabled)
+            conditions.append(Task.enabled == enabled)
 
         # Count total
-        count_result = await self.db.execute(select(Task).where(Task.deleted_at.is_(None)))
-        total = len(count_result.scalars().all())
+        total = await self.db.scalar(
+            select(func.count()).select_from(Task).where(*conditions)
+        )
 
         # Get page
-        query = query.order_by(Task.created_at.desc()).limit(limit).offset(offset)
+        query = (
+            select(Task)
+            .where(*conditions)
+            .order_by(Task.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.db.execute(query)
         tasks = result.scalars().all()
 
         return list(tasks), total
 
+    async def list_tasks_summary(
+        self,
+        owner_user_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        limit: int = 50
+    ) -> tuple[List[Row], int]:
+        """List only the columns a task overview shows, with the filtered total."""
+        conditions = [Task.deleted_at.is_(None)]
+        if owner_user_id:
+            conditions.append(Task.owner_user_id == owner_user_id)
+        if task_type:
+            conditions.append(Task.task_type == task_type)
+        if enabled is not None:
+            conditions.append(Task.enabled == enabled)
+
+        total = await self.db.scalar(
+            select(func.count()).select_from(Task).where(*conditions)
+        )
+        result = await self.db.execute(
+            select(
+                Task.task_name,
+                Task.task_type,
+                Task.schedule_cron,
+                Task.enabled,
+                Task.run_count,
+                Task.success_count,
+                Task.failure_count,
+            )
+            .where(*conditions)
+            .order_by(Task.created_at.desc())
+            .limit(limit)
+        )
+
+        return list(result.all()), total
+
     async def update_task(self, task_id: str, task_data: TaskUpdate) -> Task:
         """Update a task."""
         task = await self.get_task(task_id=task_id)
@@ -135,8 +177,6 @@ class TaskService:
         if task_data.notify_on_error is not None:
             task.notify_on_error = task_data.notify_on_error
 
-        task.updated_at = datetime.now(timezone.utc)
-
         await self.db.commit()
         await self.db.refresh(task)
 
@@ -171,6 +211,40 @@ class TaskService:
         if not task:
             raise ValueError(f"Task with ID '{task_id}' not found")
 
+        return await self._start_run(task, parameters, trigger)
+
+    async def start_task_by_name(
+        self,
+        task_name: str,
+        parameters: Optional[Dict[str, any]] = None,
+        trigger: str = "manual",
+        triggered_by_user_id: Optional[str] = None
+    ) -> Optional[tuple[Task, TaskRun, str]]:
+        """Start a task looked up by name, locking its row; None if not found.
+
+        Parameters default to the task's optional parameters.
+        """
+        result = await self.db.execute(
+            select(Task)
+            .where(Task.task_name == task_name, Task.deleted_at.is_(None))
+            .with_for_update()
+        )
+        task = result.scalar_one_or_none()
+        if not task:
+            return None
+
+        if parameters is None:
+            parameters = task.optional_parameters or {}
+        task_run, filled_prompt = await self._start_run(task, parameters, trigger)
+        return task, task_run, filled_prompt
+
+    async def _start_run(
+        self,
+        task: Task,
+        parameters: Dict[str, any],
+        trigger: str
+    ) -> tuple[TaskRun, str]:
+        """Validate and record a new run of a loaded task."""
         if not task.enabled:
             raise ValueError(f"Task '{task.task_name}' is disabled")
 
@@ -191,15 +265,10 @@ class TaskService:
             trigger=trigger,
             parameters=parameters,
             discord_channel_id=task.discord_channel_id,
-            created_at=datetime.now(timezone.utc),
         )
 
+        # run_count and last_run_at are bumped by the task_run_stats trigger
         self.db.add(task_run)
-
-        # Update task stats
-        task.run_count += 1
-        task.last_run_at = datetime.now(timezone.utc)
-
         await self.db.commit()
         await self.db.refresh(task_run)
 
@@ -254,24 +323,8 @@ class TaskService:
                 duration = (task_run.completed_at - task_run.started_at).total_seconds()
                 task_run.duration_seconds = int(duration)
 
-            # Update task stats
-            task = await self.get_task(task_id=task_run.task_id)
-            if task:
-                if status == "completed":
-                    task.success_count += 1
-                elif status == "failed":
-                    task.failure_count += 1
-
-                # Update average duration
-                if task_run.duration_seconds:
-                    if task.avg_duration_seconds:
-                        task.avg_duration_seconds = int(
-                            (task.avg_duration_seconds * (task.run_count - 1) + task_run.duration_seconds) / task.run_count
-                        )
-                    else:
-                        task.avg_duration_seconds = task_run.duration_seconds
-
-        task_run.updated_at = datetime.now(timezone.utc)
+            # Success/failure counters and the rolling average are
+            # maintained by the task_run_stats trigger
 
         await self.db.commit()
         await self.db.refresh(task_run)
@@ -286,19 +339,25 @@ class TaskService:
         offset: int = 0
     ) -> tuple[List[TaskRun], int]:
         """List task runs with filters."""
-        query = select(TaskRun)
-
+        conditions = []
         if task_id:
-            query = query.where(TaskRun.task_id == task_id)
+            conditions.append(TaskRun.task_id == task_id)
         if status:
-            query = query.where(TaskRun.status == status)
+            conditions.append(TaskRun.status == status)
 
         # Count total
-        count_result = await self.db.execute(query)
-        total = len(count_result.scalars().all())
+        total = await self.db.scalar(
+            select(func.count()).select_from(TaskRun).where(*conditions)
+        )
 
         # Get page
-        query = query.order_by(TaskRun.created_at.desc()).limit(limit).offset(offset)
+        query = (
+            select(TaskRun)
+            .where(*conditions)
+            .order_by(TaskRun.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.db.execute(query)
         runs = result.scalars().all()
 
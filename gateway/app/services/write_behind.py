@@ -0,0 +1,98 @@
+"""Write-behind buffering for append-only audit tables."""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import insert, text
+
+from app.db.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 0.05
+MAX_QUEUE_SIZE = 10000
+
+_STOP = object()
+
+
+class WriteBehindLog:
+    """Buffers rows for one table and inserts them in batches."""
+
+    def __init__(self, model: Any, name: str):
+        self._model = model
+        self._name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    def qsize(self) -> int:
+        """Rows waiting to be written."""
+        return self._queue.qsize() if self._queue else 0
+
+    def add(self, row: dict) -> None:
+        """Queue a row without waiting for the database."""
+        if self._queue is None:
+            logger.warning(f"{self._name} not started, dropping row {row.get('id')}")
+            return
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(f"{self._name} queue full, dropping row {row.get('id')}")
+
+    async def start(self):
+        """Start the background flusher."""
+        if self._flusher_task is None:
+            # Bind the queue to the running loop
+            self._queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+            self._flusher_task = asyncio.create_task(self._run())
+            logger.info(f"{self._name} flusher started")
+
+    async def stop(self):
+        """Flush everything queued so far and stop the flusher."""
+        if self._flusher_task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._flusher_task
+        self._flusher_task = None
+        self._queue = None
+        logger.info(f"{self._name} flusher stopped")
+
+    async def _run(self):
+        """Collect up to FLUSH_BATCH_SIZE rows or FLUSH_INTERVAL_SECONDS, then insert."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + FLUSH_INTERVAL_SECONDS
+            while len(batch) < FLUSH_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, rows: list[dict]):
+        """Insert a batch of rows in one multi-row statement."""
+        try:
+            async with async_session_maker() as session:
+                if session.bind.dialect.name == "postgresql":
+                    # Audit rows can tolerate losing the last few ms on a crash
+                    await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+                await session.execute(insert(self._model), rows)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} {self._name} rows: {e}")
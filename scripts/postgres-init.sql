@@ -4,6 +4,7 @@
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- For text search performance
+CREATE EXTENSION IF NOT EXISTS "citext";   -- Case-insensitive task/template names
 
 -- Set default permissions
 ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO ccadmin;
@@ -1,7 +1,17 @@
 """API tests for CC-Docker gateway."""
 
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from httpx import AsyncClient
+from starlette.testclient import TestClient
+
+from app.core.security import create_token
+from app.main import app
+from app.services.pubsub import PubSubService
+from tests.test_pubsub import FakeRedis
 
 
 class TestHealthEndpoints:
@@ -25,6 +35,14 @@ class TestHealthEndpoints:
         data = response.json()
         assert data["alive"] is True
 
+    @pytest.mark.asyncio
+    async def test_metrics(self, client: AsyncClient):
+        """Test Prometheus metrics endpoint."""
+        response = await client.get("/metrics/")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert b"discord_message_log_queue_depth" in response.content
+
 
 class TestRootEndpoints:
     """Tests for root endpoints."""
@@ -48,6 +66,35 @@ class TestRootEndpoints:
         assert data["version"] == "v1"
         assert "endpoints" in data
 
+    @pytest.mark.asyncio
+    async def test_root_etag(self, client: AsyncClient):
+        """Test root endpoint returns 304 for a matching ETag."""
+        response = await client.get("/")
+        etag = response.headers["etag"]
+
+        cached = await client.get("/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    @pytest.mark.asyncio
+    async def test_cors_allowed_origin(self, client: AsyncClient):
+        """Test CORS headers are added only for allowed origins."""
+        allowed = await client.get("/", headers={"Origin": "http://localhost:8000"})
+        assert allowed.headers["access-control-allow-origin"] == "http://localhost:8000"
+
+        denied = await client.get("/", headers={"Origin": "http://evil.example"})
+        assert "access-control-allow-origin" not in denied.headers
+
+        preflight = await client.options(
+            "/api/v1",
+            headers={
+                "Origin": "http://localhost:8000",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+        assert preflight.status_code == 200
+        assert "POST" in preflight.headers["access-control-allow-methods"]
+
 
 class TestSessionEndpoints:
     """Tests for session management endpoints."""
@@ -107,3 +154,36 @@ class TestAuthValidation:
         headers = {"Authorization": ""}
         response = await client.get("/api/v1/sessions", headers=headers)
         assert response.status_code == 401
+
+
+class TestWebSocketStream:
+    """Tests for the session stream WebSocket."""
+
+    def test_stream_uses_app_pubsub(self, monkeypatch):
+        """The mounted WebSocket app subscribes through the app-wide PubSubService."""
+        from app.api.websocket import stream
+
+        @asynccontextmanager
+        async def session_found():
+            result = MagicMock()
+            result.scalar_one_or_none.return_value = object()
+            db = AsyncMock()
+            db.execute.return_value = result
+            yield db
+
+        monkeypatch.setattr(stream, "get_db_context", session_found)
+        redis_client = FakeRedis()
+        service = PubSubService(redis_client)
+        monkeypatch.setattr(app.state, "pubsub", service, raising=False)
+
+        token = create_token("test-user")
+        client = TestClient(app)
+        with client.websocket_connect(f"/ws/v1/sessions/s1/stream?token={token}") as ws:
+            assert ws.receive_json()["event"] == "session_connected"
+            for _ in range(100):
+                if service._listeners:
+                    break
+                time.sleep(0.01)
+
+            assert "session:s1:output" in service._listeners
+            assert len(redis_client.connections) == 1
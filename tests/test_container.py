@@ -1,5 +1,8 @@
 """Container management tests for CC-Docker."""
 
+import asyncio
+
+import aiohttp
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -38,6 +41,147 @@ class TestContainerManager:
         """Test memory parsing for plain bytes."""
         assert container_manager._parse_memory("1048576") == 1048576
 
+    @pytest.mark.asyncio
+    async def test_exec_not_replayed_on_connection_error(self, container_manager):
+        """A dropped connection fails the exec instead of running the command twice."""
+        container = MagicMock()
+        container.exec = AsyncMock(side_effect=aiohttp.ClientConnectionError("reset"))
+        docker = MagicMock()
+        docker.containers.container.return_value = container
+        container_manager._get_docker = AsyncMock(return_value=docker)
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await container_manager.exec_in_container("abc", ["rm", "-rf", "/tmp/x"])
+
+        container.exec.assert_awaited_once()
+
+    @staticmethod
+    def _exec_returning(container_manager, chunks):
+        """Stub Docker so an exec streams the given output chunks."""
+        messages = [MagicMock(data=chunk) for chunk in chunks] + [None]
+        stream = MagicMock()
+        stream.read_out = AsyncMock(side_effect=messages)
+        stream.__aenter__ = AsyncMock(return_value=stream)
+        stream.__aexit__ = AsyncMock(return_value=None)
+        exec_obj = MagicMock()
+        exec_obj.start.return_value = stream
+        exec_obj.inspect = AsyncMock(return_value={"ExitCode": 0})
+        container = MagicMock()
+        container.exec = AsyncMock(return_value=exec_obj)
+        docker = MagicMock()
+        docker.containers.container.return_value = container
+        container_manager._get_docker = AsyncMock(return_value=docker)
+        return stream
+
+    @pytest.mark.asyncio
+    async def test_exec_output_at_limit_is_complete(self, container_manager, monkeypatch):
+        """Output exactly at the cap is returned whole, without a marker."""
+        from app.services import container as container_module
+
+        monkeypatch.setattr(container_module.settings, "max_exec_output_bytes", 8)
+        self._exec_returning(container_manager, [b"abcd", b"efgh"])
+
+        assert await container_manager.exec_in_container("abc", ["ls"]) == (0, "abcdefgh")
+
+    @pytest.mark.asyncio
+    async def test_exec_output_over_limit_is_truncated(self, container_manager, monkeypatch):
+        """Output past the cap is cut at the limit, marked, and fully drained."""
+        from app.services import container as container_module
+
+        monkeypatch.setattr(container_module.settings, "max_exec_output_bytes", 8)
+        stream = self._exec_returning(container_manager, [b"abcd", b"efghi", b"jkl"])
+
+        exit_code, output = await container_manager.exec_in_container("abc", ["ls"])
+
+        assert exit_code == 0
+        assert output == "abcdefgh\n[output truncated at 8 bytes]"
+        assert stream.read_out.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_status_read_is_retried(self, container_manager):
+        """Idempotent reads still get one retry on a stale connection."""
+        docker = MagicMock()
+        docker.containers.get = AsyncMock(
+            side_effect=[aiohttp.ClientConnectionError("reset"), MagicMock(_container={"Id": "abc"})]
+        )
+        container_manager._get_docker = AsyncMock(return_value=docker)
+
+        assert await container_manager.describe("abc") == {"Id": "abc"}
+        assert docker.containers.get.await_count == 2
+
+
+class TestCreateBatcher:
+    """Tests for batching container creates."""
+
+    @pytest.fixture
+    def batched_manager(self, monkeypatch):
+        """A ContainerManager with batching on and Docker stubbed out."""
+        from app.services import container as container_module
+
+        monkeypatch.setattr(container_module.settings, "create_batch_size", 4)
+        monkeypatch.setattr(container_module.settings, "create_batch_window_ms", 20)
+        manager = ContainerManager()
+        manager._get_docker = AsyncMock(return_value=MagicMock())
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_each_caller(self, batched_manager):
+        """Creates in one window go out together and each caller gets its own result."""
+        calls = []
+
+        async def post_create(docker, config, name):
+            calls.append(name)
+            return f"container-{name}"
+
+        batched_manager._post_create = post_create
+        results = await asyncio.gather(
+            *(batched_manager._submit_create(None, {}, name) for name in ("a", "b", "c"))
+        )
+
+        assert results == ["container-a", "container-b", "container-c"]
+        assert sorted(calls) == ["a", "b", "c"]
+        batched_manager._get_docker.assert_awaited_once()
+        await batched_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_propagates_errors_per_caller(self, batched_manager):
+        """One failed create fails only its own caller."""
+
+        async def post_create(docker, config, name):
+            if name == "bad":
+                raise RuntimeError("name conflict")
+            return name
+
+        batched_manager._post_create = post_create
+        results = await asyncio.gather(
+            batched_manager._submit_create(None, {}, "good"),
+            batched_manager._submit_create(None, {}, "bad"),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "good"
+        assert isinstance(results[1], RuntimeError)
+        await batched_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_creates(self, batched_manager):
+        """Creates in flight or still queued fail when the batcher is cancelled."""
+        blocked = asyncio.Event()
+
+        async def post_create(docker, config, name):
+            await blocked.wait()
+
+        batched_manager._post_create = post_create
+        callers = [
+            asyncio.create_task(batched_manager._submit_create(None, {}, str(i)))
+            for i in range(6)
+        ]
+        await asyncio.sleep(0.05)
+        await batched_manager.close()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
 
 class TestStreamParser:
     """Tests for stream parser."""
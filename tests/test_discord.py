@@ -0,0 +1,233 @@
+"""Discord bot and question handoff tests for CC-Docker."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gateway"))
+
+import app.services.discord as discord_service
+from app.api.routes.discord import _wait_for_response
+from app.db.database import get_db_context
+from app.db.models import DiscordInteraction, Session
+from app.services.discord import CCDiscordBot, _PendingQuestion, settings
+from app.services.pubsub import PubSubService
+from tests.test_pubsub import FakeRedis
+
+
+def _pending(interaction_id: str, created_at: datetime, timeout_seconds: int = 1800) -> _PendingQuestion:
+    return _PendingQuestion(
+        id=interaction_id,
+        session_id="session-1",
+        thread_id=f"thread-{interaction_id}",
+        message_id=f"message-{interaction_id}",
+        message="Which branch?",
+        created_at=created_at,
+        timeout_seconds=timeout_seconds,
+        attempt=1,
+        max_attempts=3,
+        priority="normal",
+    )
+
+
+def _scheduled(bot: CCDiscordBot) -> dict:
+    """Latest due time per scheduled interaction id, relative to now."""
+    now = asyncio.get_running_loop().time()
+    return {
+        interaction_id: due - now
+        for due, interaction_id in sorted(bot._countdown_heap)
+        if interaction_id in bot._countdown_ids
+    }
+
+
+class TestCountdownSchedule:
+    """Tests for the countdown deadline heap."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_orders_by_deadline(self):
+        """The earliest deadline is at the top of the heap."""
+        bot = CCDiscordBot(1, None)
+        bot._schedule_countdown("later", 60)
+        bot._schedule_countdown("sooner", 5)
+
+        assert bot._countdown_heap[0][1] == "sooner"
+        assert bot._countdown_ids == {"later", "sooner"}
+        assert bot._countdown_wakeup.is_set()
+
+    @pytest.mark.asyncio
+    async def test_update_reschedules_pending_question(self):
+        """A question still inside its timeout gets its next edit scheduled."""
+        bot = CCDiscordBot(1, None)
+        bot._track_pending(_pending("q1", datetime.now(timezone.utc)))
+
+        await bot.update_countdowns(["q1"])
+
+        delay = _scheduled(bot)["q1"]
+        assert settings.discord_update_interval - 1 < delay <= settings.discord_update_interval
+
+    @pytest.mark.asyncio
+    async def test_update_untracks_expired_question(self):
+        """A question past its last attempt is forgotten."""
+        bot = CCDiscordBot(1, None)
+        created = datetime.now(timezone.utc) - timedelta(hours=5)
+        bot._track_pending(_pending("q1", created, timeout_seconds=60))
+        bot._schedule_countdown("q1", 0)
+
+        await bot.update_countdowns(["q1"])
+
+        assert "q1" not in bot._pending_by_id
+        assert "q1" not in bot._countdown_ids
+
+    @pytest.mark.asyncio
+    async def test_untrack_skips_heap_entry(self, monkeypatch):
+        """Untracked questions are popped from the heap without an update."""
+        bot = CCDiscordBot(1, None)
+        bot._channel_ready.set()
+        updated = asyncio.Queue()
+
+        async def seed():
+            pass
+
+        async def update(interaction_ids):
+            updated.put_nowait(interaction_ids)
+
+        monkeypatch.setattr(bot, "_seed_countdowns", seed)
+        monkeypatch.setattr(bot, "update_countdowns", update)
+        bot._schedule_countdown("answered", 0)
+        bot._schedule_countdown("pending", 0)
+        bot._untrack_pending("answered")
+
+        task = asyncio.create_task(bot._countdown_scheduler())
+        try:
+            assert await asyncio.wait_for(updated.get(), 1) == ["pending"]
+            assert bot._countdown_heap == []
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class TestSeedCountdowns:
+    """Tests for loading pending questions at startup."""
+
+    @pytest.mark.asyncio
+    async def test_seed_tracks_pending_questions(self, test_db):
+        """Pending questions are indexed and scheduled immediately."""
+        async with get_db_context() as db:
+            db.add(Session(id="session-1", workspace_type="ephemeral"))
+            await db.flush()
+            db.add_all(
+                [
+                    DiscordInteraction(
+                        id="pending",
+                        session_id="session-1",
+                        discord_thread_id="111",
+                        discord_message_id="222",
+                        interaction_type="question",
+                        message="Which branch?",
+                        timeout_seconds=1800,
+                    ),
+                    DiscordInteraction(
+                        id="answered",
+                        session_id="session-1",
+                        discord_thread_id="333",
+                        discord_message_id="444",
+                        interaction_type="question",
+                        message="Deploy?",
+                        status="answered",
+                        timeout_seconds=1800,
+                    ),
+                ]
+            )
+
+        bot = CCDiscordBot(1, None)
+        await bot._seed_countdowns()
+
+        assert set(bot._pending_by_id) == {"pending"}
+        assert bot._pending_by_thread["111"].id == "pending"
+        assert bot._pending_by_id["pending"].created_at.tzinfo is not None
+        assert _scheduled(bot)["pending"] <= 0
+
+    @pytest.mark.asyncio
+    async def test_seed_failure_is_retried(self, monkeypatch):
+        """A failed seed is logged and retried instead of killing the scheduler."""
+        bot = CCDiscordBot(1, None)
+        bot._channel_ready.set()
+        monkeypatch.setattr(discord_service, "_SEED_RETRY_SECONDS", 0)
+        attempts = []
+        seeded = asyncio.Event()
+
+        async def seed():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("database unavailable")
+            seeded.set()
+
+        monkeypatch.setattr(bot, "_seed_countdowns", seed)
+        task = asyncio.create_task(bot._countdown_scheduler())
+        try:
+            await asyncio.wait_for(seeded.wait(), 1)
+            assert len(attempts) == 2
+            assert not task.done()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class QueueRedis(FakeRedis):
+    """FakeRedis with the list commands the answer handoff uses."""
+
+    def __init__(self):
+        super().__init__()
+        self.lists: dict = {}
+        self.lpops = 0
+
+    async def lpop(self, key):
+        self.lpops += 1
+        values = self.lists.get(key)
+        return values.pop(0) if values else None
+
+
+class TestWaitForResponse:
+    """Tests for waiting on a Discord answer."""
+
+    @pytest.mark.asyncio
+    async def test_queued_answer_is_returned(self):
+        """An answer pushed before the wait starts is picked up straight away."""
+        redis_client = QueueRedis()
+        redis_client.lists["key"] = ["yes"]
+        pubsub = PubSubService(redis_client)
+
+        assert await _wait_for_response(redis_client, pubsub, "key", "key:ready", 60) == "yes"
+        assert pubsub._listeners == {}
+
+    @pytest.mark.asyncio
+    async def test_publish_wakes_waiter(self):
+        """The bot's publish wakes the waiter without waiting for the next poll."""
+        redis_client = QueueRedis()
+        pubsub = PubSubService(redis_client)
+        waiter = asyncio.create_task(
+            _wait_for_response(redis_client, pubsub, "key", "key:ready", 60)
+        )
+        for _ in range(10):
+            await asyncio.sleep(0)
+        connection = redis_client.connections[0]
+
+        redis_client.lists["key"] = ["no"]
+        connection.deliver("key:ready", {})
+
+        assert await asyncio.wait_for(waiter, 1) == "no"
+        assert redis_client.lpops == 2
+        assert connection.closed
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self):
+        """No answer before the deadline returns None and drops the subscription."""
+        redis_client = QueueRedis()
+        pubsub = PubSubService(redis_client)
+
+        assert await _wait_for_response(redis_client, pubsub, "key", "key:ready", 0.05) is None
+        assert pubsub._listeners == {}
@@ -0,0 +1,48 @@
+"""Pydantic model tests for CC-Docker."""
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gateway"))
+
+from app.db.models import Task
+from app.models.task import TaskResponse
+
+
+class TestTaskResponse:
+    """Tests for TaskResponse."""
+
+    def test_from_orm_task(self):
+        """Test building a response directly from an ORM row."""
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        task = Task(
+            id="task-1",
+            task_name="daily-report",
+            task_type="manual",
+            description=None,
+            template_prompt="Run {report}",
+            required_parameters=["report"],
+            optional_parameters={},
+            schedule_cron=None,
+            schedule_timezone="UTC",
+            enabled=1,
+            paused=0,
+            next_run_at=None,
+            last_run_at=None,
+            discord_channel_id=None,
+            discord_category_id=None,
+            owner_user_id="user-1",
+            run_count=3,
+            success_count=2,
+            failure_count=1,
+            avg_duration_seconds=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+        response = TaskResponse.model_validate(task)
+
+        assert response.enabled is True
+        assert response.paused is False
+        assert response.model_dump(mode="json")["created_at"] == "2024-01-01T12:00:00"
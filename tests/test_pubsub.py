@@ -0,0 +1,147 @@
+"""Pub/sub service tests for CC-Docker."""
+
+import asyncio
+
+import orjson
+import pytest
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gateway"))
+
+from app.services.pubsub import PubSubService
+
+
+class FakePubSub:
+    """In-memory stand-in for a redis-py PubSub connection."""
+
+    def __init__(self):
+        self.channels: set = set()
+        self.unsubscribe_calls: list = []
+        self.closed = False
+        self._messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.unsubscribe_calls.append(channels)
+        self.channels.difference_update(channels)
+
+    async def listen(self):
+        while True:
+            yield await self._messages.get()
+
+    async def aclose(self):
+        self.closed = True
+
+    def deliver(self, channel: str, payload: dict):
+        self._messages.put_nowait(
+            {"type": "message", "channel": channel, "data": orjson.dumps(payload)}
+        )
+
+
+class FakeRedis:
+    """Counts the pub/sub connections handed out."""
+
+    def __init__(self):
+        self.connections: list = []
+
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.connections.append(pubsub)
+        return pubsub
+
+
+async def _next(iterator):
+    return await asyncio.wait_for(iterator.__anext__(), 1)
+
+
+async def _settle():
+    """Let pending tasks and call_soon callbacks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestSharedSubscriptions:
+    """Tests for multiplexing subscribers onto one connection."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_connection(self):
+        """Two subscribers on one channel use a single pub/sub connection."""
+        redis_client = FakeRedis()
+        service = PubSubService(redis_client)
+        first = service.subscribe("session:s1:output")
+        second = service.subscribe("session:s1:output")
+
+        # Start both generators so they register their listeners
+        first_read = asyncio.create_task(_next(first))
+        second_read = asyncio.create_task(_next(second))
+        await _settle()
+
+        assert len(redis_client.connections) == 1
+        connection = redis_client.connections[0]
+        assert connection.channels == {"session:s1:output"}
+
+        connection.deliver("session:s1:output", {"type": "output"})
+        assert await first_read == {"type": "output"}
+        assert await second_read == {"type": "output"}
+
+        await first.aclose()
+        assert connection.channels == {"session:s1:output"}
+        assert not connection.closed
+
+        # The last subscriber leaving releases the connection
+        await second.aclose()
+        assert connection.closed
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_messages_reach_only_their_channel(self):
+        """The shared reader routes each message to its channel's listeners."""
+        redis_client = FakeRedis()
+        service = PubSubService(redis_client)
+        first = service.subscribe("session:s1:output")
+        second = service.subscribe("session:s2:output")
+        first_read = asyncio.create_task(_next(first))
+        second_read = asyncio.create_task(_next(second))
+        await _settle()
+
+        connection = redis_client.connections[0]
+        connection.deliver("session:s2:output", {"n": 2})
+        assert await second_read == {"n": 2}
+        assert not first_read.done()
+
+        connection.deliver("session:s1:output", {"n": 1})
+        assert await first_read == {"n": 1}
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribes_are_batched(self):
+        """Channels emptied in the same iteration share one UNSUBSCRIBE."""
+        redis_client = FakeRedis()
+        service = PubSubService(redis_client)
+
+        async def noop(message):
+            pass
+
+        # A third channel keeps the connection open past the unsubscribes
+        keep = service.subscribe("session:keep:output")
+        keep_read = asyncio.create_task(_next(keep))
+        for session_id in ("s1", "s2"):
+            await service.subscribe_with_callback(f"session:{session_id}:output", noop)
+        await _settle()
+        connection = redis_client.connections[0]
+        assert len(connection.channels) == 3
+
+        await service.unsubscribe_all()
+
+        assert len(connection.unsubscribe_calls) == 1
+        assert set(connection.unsubscribe_calls[0]) == {
+            "session:s1:output",
+            "session:s2:output",
+        }
+        assert connection.channels == {"session:keep:output"}
+        keep_read.cancel()
+        await service.close()
@@ -0,0 +1,55 @@
+"""Storage service tests for CC-Docker."""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gateway"))
+
+from app.services.storage import _PartWriter
+
+
+class TestPartWriter:
+    """Tests for splitting snapshot streams into multipart parts."""
+
+    def test_splits_into_fixed_size_parts(self):
+        """Writes are cut at part boundaries regardless of write sizes."""
+        parts = []
+        writer = _PartWriter(parts.append, part_size=4)
+
+        assert writer.write(b"abc") == 3
+        assert writer.write(b"defghij") == 7
+        writer.close()
+
+        assert parts == [b"abcd", b"efgh", b"ij"]
+
+    def test_exact_multiple_has_no_short_part(self):
+        """A stream that ends on a boundary submits no empty final part."""
+        parts = []
+        writer = _PartWriter(parts.append, part_size=4)
+
+        writer.write(b"abcdefgh")
+        writer.close()
+
+        assert parts == [b"abcd", b"efgh"]
+
+    def test_small_stream_is_one_part(self):
+        """Less than one part of data is submitted only on close."""
+        parts = []
+        writer = _PartWriter(parts.append, part_size=4)
+
+        writer.write(b"ab")
+        assert parts == []
+        writer.close()
+
+        assert parts == [b"ab"]
+
+    def test_close_is_idempotent(self):
+        """Closing twice does not resubmit the last part."""
+        parts = []
+        writer = _PartWriter(parts.append, part_size=4)
+
+        writer.write(b"abcde")
+        writer.close()
+        writer.close()
+
+        assert parts == [b"abcd", b"e"]
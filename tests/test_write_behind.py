@@ -0,0 +1,92 @@
+"""Write-behind log tests for CC-Docker."""
+
+import pytest
+from sqlalchemy import func, select
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gateway"))
+
+import app.services.write_behind as write_behind
+from app.db.database import get_db_context
+from app.db.models import DiscordMessage
+from app.services.write_behind import WriteBehindLog
+
+
+def _row(n: int) -> dict:
+    return {
+        "id": f"row-{n}",
+        "message_id": str(1000 + n),
+        "channel_id": "42",
+        "message_type": "notification",
+        "content": f"message {n}",
+    }
+
+
+async def _count() -> int:
+    async with get_db_context() as db:
+        return await db.scalar(select(func.count()).select_from(DiscordMessage))
+
+
+class TestWriteBehindLog:
+    """Tests for WriteBehindLog."""
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_rows(self, test_db):
+        """Rows queued before stop() are all written."""
+        log = WriteBehindLog(DiscordMessage, "Test log")
+        await log.start()
+        for n in range(5):
+            log.add(_row(n))
+
+        await log.stop()
+
+        assert await _count() == 5
+        assert log.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_rows_are_batched(self, test_db, monkeypatch):
+        """Rows arriving together are inserted in batches of FLUSH_BATCH_SIZE."""
+        monkeypatch.setattr(write_behind, "FLUSH_BATCH_SIZE", 3)
+        log = WriteBehindLog(DiscordMessage, "Test log")
+        batches = []
+        flush = log._flush
+
+        async def record(rows):
+            batches.append(len(rows))
+            await flush(rows)
+
+        log._flush = record
+        await log.start()
+        for n in range(7):
+            log.add(_row(n))
+        await log.stop()
+
+        assert batches == [3, 3, 1]
+        assert await _count() == 7
+
+    @pytest.mark.asyncio
+    async def test_add_before_start_drops_row(self, test_db):
+        """Rows added while the flusher is not running are dropped, not raised."""
+        log = WriteBehindLog(DiscordMessage, "Test log")
+        log.add(_row(0))
+
+        assert log.qsize() == 0
+        assert await _count() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_flusher_running(self, test_db):
+        """A batch that fails to insert is logged and later batches still land."""
+        log = WriteBehindLog(DiscordMessage, "Test log")
+        await log.start()
+        # Duplicate primary keys fail the whole first batch
+        log.add(_row(0))
+        log.add(_row(0))
+        await log.stop()
+
+        await log.start()
+        log.add(_row(1))
+        await log.stop()
+
+        assert await _count() == 1